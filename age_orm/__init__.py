@@ -1,14 +1,38 @@
 """age-orm: A Python ORM for Apache AGE graph database."""
 
+from typing import TYPE_CHECKING
+
 from .models import Vertex, Edge
 from .graph import Graph, AsyncGraph
-from .database import Database, AsyncDatabase
-from .query import Query, AsyncQuery
 from .references import relationship
 from .event import listen, listens_for
 
+if TYPE_CHECKING:
+    from .database import Database, AsyncDatabase
+    from .query import Query, AsyncQuery
+
 __version__ = "0.2.0"
 
+# Imported on first access (PEP 562) so that `import age_orm` does not pull
+# in psycopg / psycopg_pool for code that only defines models.
+_LAZY_IMPORTS = {
+    "Database": ".database",
+    "AsyncDatabase": ".database",
+    "Query": ".query",
+    "AsyncQuery": ".query",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     "Vertex",
     "Edge",
@@ -1,31 +1,48 @@
 """Event system for pre/post hooks on graph operations."""
 
-from collections import defaultdict
+import sys
+from collections.abc import Callable
+from functools import partial
 
-_registrars: dict = defaultdict(lambda: defaultdict(list))
+# event -> (target class, handler) pairs in registration order.
+_registrars: dict[str, list[tuple[type, Callable]]] = {}
+
+# (event, concrete class) -> handlers that apply to instances of that class.
+# Cleared whenever a new listener is registered.
+_resolved_cache: dict[tuple[str, type], tuple[Callable, ...]] = {}
+
+
+def _resolve(event: str, cls: type) -> tuple[Callable, ...]:
+    """Collect handlers registered for cls or any of its base classes."""
+    resolved = tuple(fn for target, fn in _registrars[event] if issubclass(cls, target))
+    _resolved_cache[(event, cls)] = resolved
+    return resolved
 
 
 def dispatch(target, event: str, *args, **kwargs):
     """Fire given event for all registered handlers matching the target's type."""
-    by_event = _registrars[event]
-    for target_class in by_event:
-        if isinstance(target, target_class):
-            for fn in by_event[target_class]:
-                fn(target, event, *args, **kwargs)
+    if event not in _registrars:
+        return
+    handlers = _resolved_cache.get((event, type(target)))
+    if handlers is None:
+        handlers = _resolve(event, type(target))
+    for fn in handlers:
+        fn(target, event, *args, **kwargs)
 
 
 def listen(target, event: str | list[str], fn):
     """Register fn to listen for event(s) on target class."""
     events = [event] if isinstance(event, str) else event
     for ev in events:
-        _registrars[ev][target].append(fn)
+        _registrars.setdefault(sys.intern(ev), []).append((target, fn))
+    _resolved_cache.clear()
 
 
-def listens_for(target, event: str | list[str]):
-    """Decorator to register fn to listen for event(s) on target class."""
+def _listen_and_return(target, event: str | list[str], fn):
+    listen(target, event, fn)
+    return fn
 
-    def decorator(fn):
-        listen(target, event, fn)
-        return fn
 
-    return decorator
+def listens_for(target, event: str | list[str]):
+    """Decorator to register fn to listen for event(s) on target class."""
+    return partial(_listen_and_return, target, event)
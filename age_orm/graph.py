@@ -5,6 +5,13 @@ from __future__ import annotations
 import json
 import logging
 import re
+import sys
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from typing import Any, TypeVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,16 +19,16 @@ if TYPE_CHECKING:
     from age_orm.query.builder import Query, AsyncQuery
 
 from age_orm.event import dispatch
-from age_orm.exceptions import EntityNotFoundError
+from age_orm.exceptions import EntityNotFoundError, LabelNotFoundError
 from age_orm.models.base import AgeModel
 from age_orm.models.vertex import Vertex
 from age_orm.models.edge import Edge
 from age_orm.utils.serialization import (
     dict_to_model,
-    escape_sql_literal,
     format_cypher_value,
+    json_loads,
+    models_to_agtype,
     model_to_cypher_properties,
-    substitute_cypher_params,
     to_agtype_properties,
 )
 
@@ -29,6 +36,47 @@ log = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=AgeModel)
 
+class _Session:
+    """A session()'s pooled connection, usable only until its block exits.
+
+    Tasks and copied contexts started inside the block keep a reference to
+    this holder after it ends; marking it closed stops them from reusing a
+    connection that is back in the pool.
+    """
+
+    __slots__ = ("closed", "conn", "pool")
+
+    def __init__(self, pool: Any, conn: Any):
+        self.pool = pool
+        self.conn = conn
+        self.closed = False
+
+
+# Session held by the current thread's or task's session(), if any.
+_current_session: ContextVar[_Session | None] = ContextVar(
+    "age_orm_current_session", default=None
+)
+
+
+def _session_conn(pool: Any) -> Any:
+    """Return the open session's connection in this context if it is from pool."""
+    session = _current_session.get()
+    if session is not None and not session.closed and session.pool is pool:
+        return session.conn
+    return None
+
+# Batches larger than this are streamed with COPY instead of a VALUES list.
+_COPY_THRESHOLD = 500
+
+# Draws `count` graphids from a label's sequence, as its id column default would.
+_ALLOCATE_IDS_SQL = (
+    "SELECT ag_catalog._graphid(l.id, nextval(format('%%I.%%I', g.name, l.seq_name)::regclass)) "
+    "FROM ag_catalog.ag_label l "
+    "JOIN ag_catalog.ag_graph g ON g.graphid = l.graph, "
+    "generate_series(1, %s) "
+    "WHERE g.name = %s AND l.name = %s"
+)
+
 
 class Graph:
     """Synchronous graph operations.
@@ -40,11 +88,60 @@ class Graph:
     def __init__(self, name: str, db: "Database"):
         self._name = name
         self._db = db
+        # Labels confirmed to exist in this graph; skips the catalog lookup.
+        self._known_labels: set[str] = set()
+        # Shared (mutated in place) registry, bound here for _hydrate_result.
+        self._label_registry = AgeModel._label_registry
+        # Vertices queued by add_deferred(), inserted by flush().
+        self._pending_adds: list[Vertex] = []
 
     @property
     def name(self) -> str:
         return self._name
 
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        """Run this thread's graph calls on a single pooled connection.
+
+        Inside the block, every Graph call on the same database reuses one
+        connection instead of checking one out per statement, and all
+        statements share one transaction, committed on exit, rather than
+        paying a commit round-trip each. Nested sessions reuse the outer
+        connection. Code running under a context copied inside the block
+        (copy_context().run, asyncio.to_thread) only shares it while the
+        block is open.
+
+        cached=True reads inside the block bypass the result cache, since
+        they may see uncommitted writes.
+
+        Usage:
+            with graph.session():
+                graph.add(alice)
+                graph.connect(alice, knows, bob)
+        """
+        conn = self._session_conn()
+        if conn is not None:
+            yield conn
+            return
+        try:
+            with self._db._pool.connection() as conn:
+                session = _Session(self._db._pool, conn)
+                token = _current_session.set(session)
+                try:
+                    yield conn
+                finally:
+                    session.closed = True
+                    _current_session.reset(token)
+        finally:
+            # Writes bumped the graph's version before committing, so results
+            # cached meanwhile by other callers may predate the commit (or
+            # the rollback); invalidate them now that it is settled.
+            self._db._results.bump(self._name)
+
+    def _session_conn(self):
+        """Return the current session's connection if it belongs to our pool."""
+        return _session_conn(self._db._pool)
+
     # === Cypher Execution ===
 
     def _execute_cypher(
@@ -53,51 +150,53 @@ class Graph:
         params: dict[str, Any] | None = None,
         columns: list[str] | None = None,
         return_type: str = "vertex",
+        conn=None,
+        cached: bool = False,
     ) -> list[dict]:
         """Execute Cypher within AGE's SQL wrapper.
 
         Args:
             cypher: Cypher query string with optional $param placeholders.
-            params: Parameter values to substitute into the Cypher.
+            params: Parameter values, sent to the server as one agtype map.
             columns: Column definitions for the AS clause. Defaults to single "result agtype".
             return_type: Hint for parsing results ("vertex", "edge", "scalar", "raw").
+            conn: Connection to run on. Defaults to the session's connection,
+                or one checked out from the pool.
+            cached: Serve and store results in the database's result cache.
+                Only for read-only Cypher.
 
         Returns:
             List of parsed result dicts.
         """
-        # Substitute parameters into Cypher
-        resolved_cypher = substitute_cypher_params(cypher, params)
-
-        # Build column clause (quote names to avoid reserved-word conflicts)
-        if columns:
-            col_clause = ", ".join(f'"{c}" agtype' for c in columns)
+        sql, args = _cypher_sql(self._name, cypher, columns, params)
+        if conn is None:
+            conn = self._session_conn()
+        # A caller's or session's transaction may hold uncommitted writes
+        cached = cached and conn is None
+        if cached:
+            cache_key = self._db._results.key(self._name, (sql, args, return_type))
+            results = self._db._results.get(cache_key)
+            if results is not None:
+                return results
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Executing: %s %s", sql, args)
+
+        if conn is None:
+            with self._db._pool.connection() as conn:
+                rows = conn.execute(sql, args).fetchall()
         else:
-            col_clause = "result agtype"
+            rows = conn.execute(sql, args).fetchall()
 
-        sql = f"SELECT * FROM cypher('{self._name}', $$ {resolved_cypher} $$) AS ({col_clause})"
-        log.debug("Executing: %s", sql)
-
-        with self._db._pool.connection() as conn:
-            rows = conn.execute(sql).fetchall()
-
-        return self._parse_results(rows, return_type, num_columns=len(columns) if columns else 1)
+        results = self._parse_results(rows, return_type, num_columns=len(columns) if columns else 1)
+        if cached:
+            self._db._results.put(cache_key, results)
+        return results
 
     def _parse_results(
         self, rows: list[tuple], return_type: str, num_columns: int = 1
     ) -> list[dict]:
         """Parse raw agtype result rows into dicts."""
-        results = []
-        for row in rows:
-            if num_columns == 1:
-                parsed = _parse_agtype_result(row[0], return_type)
-                results.append(parsed)
-            else:
-                # Multiple columns
-                parsed_row = {}
-                for i, val in enumerate(row):
-                    parsed_row[f"col_{i}"] = _parse_agtype_result(val, "raw")
-                results.append(parsed_row)
-        return results
+        return _parse_result_rows(rows, return_type, num_columns)
 
     # === CRUD Operations ===
 
@@ -107,12 +206,12 @@ class Graph:
         The vertex must not already have a graph_id (i.e., must be new).
         """
         dispatch(entity, "pre_add", graph=self)
-        self.ensure_label(type(entity))
 
-        props = model_to_cypher_properties(entity)
-        label = entity.label
-        cypher = f"CREATE (n:{label} {props}) RETURN n"
-        results = self._execute_cypher(cypher, return_type="vertex")
+        cypher = _build_create_cypher(entity.label, model_to_cypher_properties(entity))
+        with self.session() as conn:
+            self.ensure_label(type(entity), conn=conn)
+            results = self._execute_cypher(cypher, return_type="vertex", conn=conn)
+        self._db._results.bump(self._name)
 
         if results:
             entity._graph_id = results[0].get("graph_id")
@@ -124,13 +223,18 @@ class Graph:
         return entity
 
     def update(self, entity: Vertex | Edge, only_dirty: bool = False) -> Vertex | Edge:
-        """Update an existing entity in the graph."""
+        """Update an existing entity in the graph.
+
+        Only modified fields are written when the entity has any. A clean
+        entity is written in full unless only_dirty is set, in which case
+        the update is skipped.
+        """
         if entity.graph_id is None:
             raise EntityNotFoundError("Cannot update entity without graph_id")
 
         dispatch(entity, "pre_update", graph=self)
 
-        if only_dirty:
+        if only_dirty or entity._dirty:
             props = entity.dirty_fields_dump(mode="json")
         else:
             props = entity.model_dump(mode="json")
@@ -138,12 +242,9 @@ class Graph:
         if not props:
             return entity
 
-        # Build SET clause (backtick-escape names to avoid reserved-word conflicts)
-        set_parts = ", ".join(
-            f"n.`{k}` = {format_cypher_value(v)}" for k, v in props.items()
-        )
-        cypher = f"MATCH (n) WHERE id(n) = {entity.graph_id} SET {set_parts} RETURN n"
+        cypher = _build_update_cypher(entity.graph_id, props)
         self._execute_cypher(cypher, return_type="vertex")
+        self._db._results.bump(self._name)
 
         entity._dirty.clear()
         dispatch(entity, "post_update", graph=self)
@@ -156,12 +257,10 @@ class Graph:
 
         dispatch(entity, "pre_delete", graph=self)
 
-        if isinstance(entity, Vertex):
-            cypher = f"MATCH (n) WHERE id(n) = {entity.graph_id} DETACH DELETE n"
-        else:
-            cypher = f"MATCH ()-[e]->() WHERE id(e) = {entity.graph_id} DELETE e"
+        cypher = _build_delete_cypher(entity)
 
         self._execute_cypher(cypher, return_type="raw")
+        self._db._results.bump(self._name)
         entity._graph_id = None
         entity._db = None
         entity._graph = None
@@ -179,15 +278,14 @@ class Graph:
             )
 
         dispatch(edge, "pre_add", graph=self)
-        self.ensure_label(type(edge), kind="e")
 
-        props = model_to_cypher_properties(edge)
-        label = edge.label
-        cypher = (
-            f"MATCH (a), (b) WHERE id(a) = {from_v.graph_id} AND id(b) = {to_v.graph_id} "
-            f"CREATE (a)-[e:{label} {props}]->(b) RETURN e"
+        cypher = _build_connect_cypher(
+            from_v.graph_id, to_v.graph_id, edge.label, model_to_cypher_properties(edge)
         )
-        results = self._execute_cypher(cypher, return_type="edge")
+        with self.session() as conn:
+            self.ensure_label(type(edge), kind="e", conn=conn)
+            results = self._execute_cypher(cypher, return_type="edge", conn=conn)
+        self._db._results.bump(self._name)
 
         if results:
             edge._graph_id = results[0].get("graph_id")
@@ -217,35 +315,31 @@ class Graph:
 
         model_class = type(entities[0])
         resolved_label = label or entities[0].label
-        self.ensure_label(model_class)
 
-        # Build batch INSERT values
-        values_parts = []
-        for entity in entities:
-            props = entity.model_dump(mode="json")
-            agtype_str = to_agtype_properties(props)
-            agtype_sql = escape_sql_literal(agtype_str)
-            values_parts.append(f"('{agtype_sql}'::agtype)")
-
-        sql_stmt = (
-            f'INSERT INTO {self._name}."{resolved_label}" (properties) '
-            f'VALUES {", ".join(values_parts)}'
-        )
-
-        with self._db._pool.connection() as conn:
-            conn.execute(sql_stmt)
-
-            # Fetch the last N inserted rows to get graphids
-            rows = conn.execute(
-                f'SELECT id FROM {self._name}."{resolved_label}" '
-                f"ORDER BY id DESC LIMIT {len(entities)}"
-            ).fetchall()
-
-        # Rows come in reverse order, reverse to match entity order
-        rows.reverse()
+        agtype_strs = models_to_agtype(entities)
+
+        with self.session() as conn:
+            self.ensure_label(model_class, conn=conn, label=resolved_label)
+            if len(entities) > _COPY_THRESHOLD:
+                # COPY skips the SQL parser entirely, but returns nothing,
+                # so the ids are allocated up front and written explicitly.
+                ids = self._allocate_ids(conn, resolved_label, len(entities))
+                copy_sql = f'COPY {self._name}."{resolved_label}" (id, properties) FROM STDIN'
+                with conn.cursor().copy(copy_sql) as copy:
+                    for graph_id, agtype_str in zip(ids, agtype_strs):
+                        copy.write_row((graph_id, agtype_str))
+            else:
+                sql_stmt = (
+                    f'INSERT INTO {self._name}."{resolved_label}" (properties) '
+                    f'VALUES {", ".join(["(%s::agtype)"] * len(agtype_strs))} RETURNING id'
+                )
+                # RETURNING yields ids in VALUES order, in the same roundtrip and
+                # without racing concurrent writers to the label table.
+                ids = [row[0] for row in conn.execute(sql_stmt, agtype_strs).fetchall()]
+        self._db._results.bump(self._name)
 
-        for entity, row in zip(entities, rows):
-            entity._graph_id = int(row[0])
+        for entity, graph_id in zip(entities, ids):
+            entity._graph_id = int(graph_id)
             entity._dirty.clear()
             entity._db = self._db
             entity._graph = self
@@ -270,41 +364,43 @@ class Graph:
             return []
 
         resolved_label = label or triples[0][1].label
-        self.ensure_label(type(triples[0][1]), kind="e")
 
-        values_parts = []
-        for from_v, edge, to_v in triples:
+        for from_v, _, to_v in triples:
             if from_v.graph_id is None or to_v.graph_id is None:
                 raise EntityNotFoundError(
                     "All vertices must be persisted before bulk edge insert"
                 )
-            props = edge.model_dump(mode="json")
-            agtype_str = to_agtype_properties(props)
-            agtype_sql = escape_sql_literal(agtype_str)
-            values_parts.append(
-                f"(ag_catalog.graphid_in('{from_v.graph_id}'), "
-                f"ag_catalog.graphid_in('{to_v.graph_id}'), "
-                f"'{agtype_sql}'::agtype)"
-            )
-
-        sql_stmt = (
-            f'INSERT INTO {self._name}."{resolved_label}" (start_id, end_id, properties) '
-            f'VALUES {", ".join(values_parts)}'
-        )
-
-        with self._db._pool.connection() as conn:
-            conn.execute(sql_stmt)
-
-            rows = conn.execute(
-                f'SELECT id, start_id, end_id FROM {self._name}."{resolved_label}" '
-                f"ORDER BY id DESC LIMIT {len(triples)}"
-            ).fetchall()
-
-        rows.reverse()
+        agtype_strs = models_to_agtype(edge for _, edge, _ in triples)
+
+        with self.session() as conn:
+            self.ensure_label(type(triples[0][1]), kind="e", conn=conn, label=resolved_label)
+            if len(triples) > _COPY_THRESHOLD:
+                ids = self._allocate_ids(conn, resolved_label, len(triples))
+                copy_sql = (
+                    f'COPY {self._name}."{resolved_label}" '
+                    f"(id, start_id, end_id, properties) FROM STDIN"
+                )
+                with conn.cursor().copy(copy_sql) as copy:
+                    for graph_id, (from_v, _, to_v), agtype_str in zip(
+                        ids, triples, agtype_strs
+                    ):
+                        copy.write_row((graph_id, from_v.graph_id, to_v.graph_id, agtype_str))
+            else:
+                # graphids are bound as text so they go through graphid's input function
+                params = []
+                for (from_v, _, to_v), agtype_str in zip(triples, agtype_strs):
+                    params += (str(from_v.graph_id), str(to_v.graph_id), agtype_str)
+                row_sql = "(%s::ag_catalog.graphid, %s::ag_catalog.graphid, %s::agtype)"
+                sql_stmt = (
+                    f'INSERT INTO {self._name}."{resolved_label}" (start_id, end_id, properties) '
+                    f'VALUES {", ".join([row_sql] * len(triples))} RETURNING id'
+                )
+                ids = [row[0] for row in conn.execute(sql_stmt, params).fetchall()]
+        self._db._results.bump(self._name)
 
         edges = []
-        for (from_v, edge, to_v), row in zip(triples, rows):
-            edge._graph_id = int(row[0])
+        for (from_v, edge, to_v), graph_id in zip(triples, ids):
+            edge._graph_id = int(graph_id)
             edge._start_id = from_v.graph_id
             edge._end_id = to_v.graph_id
             edge._dirty.clear()
@@ -314,6 +410,118 @@ class Graph:
 
         return edges
 
+    def add_deferred(self, entity: Vertex) -> Vertex:
+        """Queue a vertex to be inserted by the next flush()."""
+        self._pending_adds.append(entity)
+        return entity
+
+    def flush(self, concurrency: int = 1) -> list[Vertex]:
+        """Insert the vertices queued with add_deferred().
+
+        Each model class/label group goes in with one bulk_add() statement,
+        and pre_add/post_add events fire as for add().
+
+        Args:
+            concurrency: Insert up to this many label groups at once, each on
+                its own pooled connection and transaction. Ignored inside a
+                session(), whose statements share one connection.
+
+        Returns:
+            The flushed vertices, in queue order, with graph_ids populated.
+            If an insert fails, the vertices it left without a graph_id stay
+            queued for the next flush() and the error is re-raised. Inside a
+            session() the failed transaction takes earlier groups down with
+            it, so every vertex is requeued and any id it was given cleared.
+        """
+        pending, self._pending_adds = self._pending_adds, []
+        in_session = self._session_conn() is not None
+        groups: dict[tuple[type, str], list[Vertex]] = {}
+        try:
+            for entity in pending:
+                dispatch(entity, "pre_add", graph=self)
+                groups.setdefault((type(entity), entity.label), []).append(entity)
+            batches = [(entities, label) for (_, label), entities in groups.items()]
+            self._run_groups(self.bulk_add, batches, concurrency)
+        except BaseException:
+            if in_session:
+                for entity in pending:
+                    if entity.graph_id is not None:
+                        entity._graph_id = None
+                        entity._db = None
+                        entity._graph = None
+                        entity._age_dirty = type(entity)._age_all_bits
+                unflushed = pending
+            else:
+                # Groups that went in have their ids and are committed
+                unflushed = [e for e in pending if e.graph_id is None]
+            # Requeue in order, ahead of anything queued meanwhile
+            self._pending_adds[:0] = unflushed
+            raise
+        for entity in pending:
+            dispatch(entity, "post_add", graph=self)
+        return pending
+
+    def connect_many(
+        self, triples: list[tuple[Vertex, Edge, Vertex]], concurrency: int = 1
+    ) -> list[Edge]:
+        """Create several edges, like repeated connect() calls.
+
+        Each edge class/label group goes in with one bulk_add_edges()
+        statement, and pre_add/post_add events fire as for connect().
+
+        Args:
+            triples: List of (from_vertex, edge, to_vertex) tuples.
+            concurrency: Insert up to this many label groups at once; see flush().
+
+        Returns:
+            The edges, in input order, with graph_ids and endpoints populated.
+        """
+        for from_v, _, to_v in triples:
+            if from_v.graph_id is None or to_v.graph_id is None:
+                raise EntityNotFoundError(
+                    "Both vertices must be persisted before creating an edge"
+                )
+        groups: dict[tuple[type, str], list[tuple[Vertex, Edge, Vertex]]] = {}
+        for triple in triples:
+            edge = triple[1]
+            dispatch(edge, "pre_add", graph=self)
+            groups.setdefault((type(edge), edge.label), []).append(triple)
+        batches = [(group, label) for (_, label), group in groups.items()]
+        self._run_groups(self.bulk_add_edges, batches, concurrency)
+        edges = [edge for _, edge, _ in triples]
+        for edge in edges:
+            dispatch(edge, "post_add", graph=self)
+        return edges
+
+    def _run_groups(
+        self, insert: Callable[..., Any], batches: list[tuple[list, str]], concurrency: int
+    ) -> None:
+        """Call insert(items, label=label) for each batch, concurrently if allowed."""
+        if concurrency > 1 and len(batches) > 1 and self._session_conn() is None:
+            # Worker threads start without our context, so each bulk call
+            # checks out (and commits on) a connection of its own.
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+                futures = [executor.submit(insert, items, label=label) for items, label in batches]
+                for future in futures:
+                    future.result()
+            return
+        for items, label in batches:
+            insert(items, label=label)
+
+    def _allocate_ids(self, conn, label: str, count: int) -> list:
+        """Reserve `count` graphids for rows about to be COPYed into label."""
+        ids = [
+            row[0]
+            for row in conn.execute(_ALLOCATE_IDS_SQL, (count, self._name, label)).fetchall()
+        ]
+        if len(ids) != count:
+            # No rows means the label's table is missing; the caller's COPY
+            # would then write nothing and leave every graph_id unset.
+            raise LabelNotFoundError(
+                f"Could not allocate {count} ids for label '{label}' in graph '{self._name}'"
+            )
+        return ids
+
     # === Query ===
 
     def query(self, model_class: type[T]) -> "Query[T]":
@@ -330,13 +538,13 @@ class Graph:
         """
         if not isinstance(data, dict):
             return data
-        # Multi-column result: hydrate each column value
-        if any(k.startswith("col_") for k in data):
+        # Multi-column result: hydrate each column value (keys are col_0..col_N)
+        if "col_0" in data:
             return {k: self._hydrate_result(v) for k, v in data.items()}
         # Only hydrate dicts that look like a vertex/edge (have label + properties)
         if "label" not in data or "properties" not in data:
             return data
-        model_class = AgeModel._label_registry.get(data["label"])
+        model_class = self._label_registry.get(data["label"])
         if model_class is None:
             return data
         return dict_to_model(data, model_class, db=self._db, graph=self)
@@ -346,6 +554,7 @@ class Graph:
         statement: str,
         columns: list[str] | None = None,
         return_type: str = "raw",
+        cached: bool = False,
         **params,
     ) -> list:
         """Execute raw Cypher and return results.
@@ -357,10 +566,12 @@ class Graph:
                 column name (instead of col_0, col_1, ...) and scalar
                 values wrapped in {"value": x} are automatically unwrapped.
             return_type: How to parse results ("vertex", "edge", "raw").
+            cached: Reuse results of an identical earlier read until the next
+                write made through this ORM. Only for read-only statements.
             **params: Parameter values to substitute ($name placeholders).
         """
         results = self._execute_cypher(
-            statement, params=params, columns=columns, return_type=return_type
+            statement, params=params, columns=columns, return_type=return_type, cached=cached
         )
         hydrated = [self._hydrate_result(r) for r in results]
         if columns:
@@ -375,6 +586,7 @@ class Graph:
         direction: str = "any",
         depth: int = 1,
         only: list[type[AgeModel] | str] | None = None,
+        cached: bool = False,
     ) -> None:
         """Populate vertex._relations with connected entities.
 
@@ -386,6 +598,7 @@ class Graph:
             direction: "outbound", "inbound", or "any".
             depth: Maximum traversal depth.
             only: Restrict to specific edge labels or model classes.
+            cached: Serve from the database's result cache (see cypher()).
         """
         if vertex.graph_id is None:
             raise EntityNotFoundError("Cannot expand vertex without graph_id")
@@ -401,32 +614,31 @@ class Graph:
             f"WHERE id(n) = {vertex.graph_id} RETURN e, m"
         )
         results = self._execute_cypher(
-            cypher, columns=["e", "m"], return_type="raw"
+            cypher, columns=["e", "m"], return_type="raw", cached=cached
         )
 
-        vertex._relations = {}
+        # Group by edge label
+        relations = defaultdict(list)
+        hydrate = self._hydrate_result
         for row in results:
-            edge_data = row.get("col_0")
-            target_data = row.get("col_1")
+            # Both columns are always present; SQL nulls parse to {}
+            edge_data = row["col_0"]
+            target_data = row["col_1"]
             if not edge_data or not target_data:
                 continue
 
             # VLE returns edge paths as {"value": [edge_dict, ...]}
             # Extract the last edge (direct connection to target) for labeling
-            if "value" in edge_data and isinstance(edge_data["value"], list):
-                edge_list = edge_data["value"]
+            edge_list = edge_data.get("value")
+            if isinstance(edge_list, list):
                 if not edge_list:
                     continue
                 edge_data = edge_list[-1]
 
-            # Group by edge label
-            edge_label = edge_data.get("label", "unknown") if isinstance(edge_data, dict) else "unknown"
-            if edge_label not in vertex._relations:
-                vertex._relations[edge_label] = []
-            vertex._relations[edge_label].append({
-                "edge": self._hydrate_result(edge_data),
-                "target": self._hydrate_result(target_data),
-            })
+            relations[edge_data.get("label", "unknown")].append(
+                {"edge": hydrate(edge_data), "target": hydrate(target_data)}
+            )
+        vertex._relations = dict(relations)
 
     def traverse(
         self,
@@ -435,6 +647,7 @@ class Graph:
         depth: int = 1,
         direction: str = "outbound",
         target_class: type[T] | None = None,
+        cached: bool = False,
     ) -> list[T] | list[dict]:
         """Traverse from a vertex along edges with the given label.
 
@@ -445,6 +658,7 @@ class Graph:
             direction: "outbound", "inbound", or "any".
             target_class: If provided, hydrate results into this model class.
                 When omitted, results are auto-hydrated via the label registry.
+            cached: Serve from the database's result cache (see cypher()).
 
         Returns:
             List of target vertices as model instances (or dicts for unknown labels).
@@ -452,6 +666,47 @@ class Graph:
         if vertex.graph_id is None:
             raise EntityNotFoundError("Cannot traverse from vertex without graph_id")
 
+        return self._traverse(
+            "(n)", f"id(n) = {vertex.graph_id}", None,
+            edge_label, depth, direction, target_class, cached,
+        )
+
+    def traverse_by(
+        self,
+        model_class: type[AgeModel],
+        field: str,
+        value: Any,
+        edge_label: str,
+        depth: int = 1,
+        direction: str = "outbound",
+        target_class: type[T] | None = None,
+        cached: bool = False,
+    ) -> list[T] | list[dict]:
+        """Traverse from the vertices of model_class whose field equals value.
+
+        Same as looking the starting vertex up and calling traverse(), but
+        in a single statement.
+
+        Example:
+            friends = graph.traverse_by(Person, "name", "Alice", "KNOWS")
+        """
+        label = getattr(model_class, "__label__", None) or model_class.__name__
+        return self._traverse(
+            f"(n:{label})", f"n.{field} = $value", {"value": value},
+            edge_label, depth, direction, target_class, cached,
+        )
+
+    def _traverse(
+        self,
+        start: str,
+        condition: str,
+        params: dict[str, Any] | None,
+        edge_label: str,
+        depth: int,
+        direction: str,
+        target_class: type[T] | None,
+        cached: bool,
+    ) -> list[T] | list[dict]:
         dir_left = "<" if direction == "inbound" else ""
         dir_right = ">" if direction == "outbound" else ""
         if direction == "any":
@@ -459,10 +714,12 @@ class Graph:
             dir_right = ""
 
         cypher = (
-            f"MATCH (n){dir_left}-[:{edge_label}*1..{depth}]-{dir_right}(m) "
-            f"WHERE id(n) = {vertex.graph_id} RETURN m"
+            f"MATCH {start}{dir_left}-[:{edge_label}*1..{depth}]-{dir_right}(m) "
+            f"WHERE {condition} RETURN m"
+        )
+        results = self._execute_cypher(
+            cypher, params=params, return_type="vertex", cached=cached
         )
-        results = self._execute_cypher(cypher, return_type="vertex")
 
         if target_class:
             return [
@@ -472,32 +729,42 @@ class Graph:
 
     # === Schema Management ===
 
-    def ensure_label(self, model_class: type[AgeModel], kind: str = "v") -> None:
+    def ensure_label(
+        self, model_class: type[AgeModel], kind: str = "v", conn=None, label: str | None = None
+    ) -> None:
         """Ensure a vertex or edge label exists in the graph, creating if needed.
 
         Args:
             model_class: The model class to create a label for.
             kind: "v" for vertex, "e" for edge.
+            conn: Connection to run on. Defaults to the session's connection,
+                or one checked out from the pool.
+            label: Label to ensure instead of the model class's own.
         """
-        label = getattr(model_class, "__label__", None) or model_class.__name__
-
-        with self._db._pool.connection() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM information_schema.tables "
-                "WHERE table_schema = %s AND table_name = %s",
-                (self._name, label),
-            ).fetchone()
-
-            if row is None:
-                if kind == "v":
-                    conn.execute(
-                        f"SELECT create_vlabel('{self._name}', '{label}')"
-                    )
-                else:
-                    conn.execute(
-                        f"SELECT create_elabel('{self._name}', '{label}')"
-                    )
-                log.info("Created %s label: %s", "vertex" if kind == "v" else "edge", label)
+        label = label or getattr(model_class, "__label__", None) or model_class.__name__
+        if label in self._known_labels:
+            return
+
+        if conn is None:
+            conn = self._session_conn()
+        if conn is None:
+            with self._db._pool.connection() as conn:
+                self._create_label_if_missing(conn, label, kind)
+            self._known_labels.add(label)
+        elif not self._create_label_if_missing(conn, label, kind):
+            # A label created on a caller's connection is only remembered
+            # once seen again, since that transaction may still roll back.
+            self._known_labels.add(label)
+
+    def _create_label_if_missing(self, conn, label: str, kind: str) -> bool:
+        """Create label on conn unless it exists. Returns True if created."""
+        row = conn.execute(_LABEL_EXISTS_SQL, (self._name, label), prepare=True).fetchone()
+        if row is not None:
+            return False
+
+        conn.execute(_build_create_label_sql(self._name, label, kind))
+        log.info("Created %s label: %s", "vertex" if kind == "v" else "edge", label)
+        return True
 
     def create_index(
         self, model_class: type[AgeModel], field: str, unique: bool = False
@@ -530,45 +797,96 @@ class AsyncGraph:
     def __init__(self, name: str, db: "AsyncDatabase"):
         self._name = name
         self._db = db
+        self._known_labels: set[str] = set()
+        self._label_registry = AgeModel._label_registry
 
     @property
     def name(self) -> str:
         return self._name
 
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Any]:
+        """Run this task's graph calls on a single pooled connection.
+
+        Inside the block, every AsyncGraph call on the same database reuses
+        one connection instead of checking one out per statement, and all
+        statements share one transaction, committed on exit. Nested
+        sessions reuse the outer connection. Tasks spawned inside the block
+        share it while the block is open, so avoid running graph calls from
+        them concurrently; once it exits they check out their own.
+
+        cached=True reads inside the block bypass the result cache, as
+        for Graph.session().
+
+        Usage:
+            async with graph.session():
+                await graph.add(alice)
+                await graph.add(bob)
+        """
+        conn = self._session_conn()
+        if conn is not None:
+            yield conn
+            return
+        try:
+            async with self._db._pool.connection() as conn:
+                session = _Session(self._db._pool, conn)
+                token = _current_session.set(session)
+                try:
+                    yield conn
+                finally:
+                    session.closed = True
+                    _current_session.reset(token)
+        finally:
+            # Invalidate results cached against the pre-commit state
+            self._db._results.bump(self._name)
+
+    def _session_conn(self):
+        """Return the current session's connection if it belongs to our pool."""
+        return _session_conn(self._db._pool)
+
     async def _execute_cypher(
         self,
         cypher: str,
         params: dict[str, Any] | None = None,
         columns: list[str] | None = None,
         return_type: str = "vertex",
+        conn=None,
+        cached: bool = False,
     ) -> list[dict]:
         """Execute Cypher within AGE's SQL wrapper (async)."""
-        resolved_cypher = substitute_cypher_params(cypher, params)
-
-        # Quote column names to avoid reserved-word conflicts
-        if columns:
-            col_clause = ", ".join(f'"{c}" agtype' for c in columns)
+        sql, args = _cypher_sql(self._name, cypher, columns, params)
+        if conn is None:
+            conn = self._session_conn()
+        # A caller's or session's transaction may hold uncommitted writes
+        cached = cached and conn is None
+        if cached:
+            cache_key = self._db._results.key(self._name, (sql, args, return_type))
+            results = self._db._results.get(cache_key)
+            if results is not None:
+                return results
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Executing: %s %s", sql, args)
+
+        if conn is None:
+            async with self._db._pool.connection() as conn:
+                rows = await (await conn.execute(sql, args)).fetchall()
         else:
-            col_clause = "result agtype"
-
-        sql = f"SELECT * FROM cypher('{self._name}', $$ {resolved_cypher} $$) AS ({col_clause})"
-        log.debug("Executing: %s", sql)
+            rows = await (await conn.execute(sql, args)).fetchall()
 
-        async with self._db._pool.connection() as conn:
-            result = await conn.execute(sql)
-            rows = await result.fetchall()
-
-        return _parse_result_rows(rows, return_type, num_columns=len(columns) if columns else 1)
+        results = _parse_result_rows(rows, return_type, num_columns=len(columns) if columns else 1)
+        if cached:
+            self._db._results.put(cache_key, results)
+        return results
 
     async def add(self, entity: Vertex) -> Vertex:
         """Add a vertex to the graph (async)."""
         dispatch(entity, "pre_add", graph=self)
-        await self.ensure_label(type(entity))
 
-        props = model_to_cypher_properties(entity)
-        label = entity.label
-        cypher = f"CREATE (n:{label} {props}) RETURN n"
-        results = await self._execute_cypher(cypher, return_type="vertex")
+        cypher = _build_create_cypher(entity.label, model_to_cypher_properties(entity))
+        async with self.session() as conn:
+            await self.ensure_label(type(entity), conn=conn)
+            results = await self._execute_cypher(cypher, return_type="vertex", conn=conn)
+        self._db._results.bump(self._name)
 
         if results:
             entity._graph_id = results[0].get("graph_id")
@@ -586,7 +904,7 @@ class AsyncGraph:
 
         dispatch(entity, "pre_update", graph=self)
 
-        if only_dirty:
+        if only_dirty or entity._dirty:
             props = entity.dirty_fields_dump(mode="json")
         else:
             props = entity.model_dump(mode="json")
@@ -594,11 +912,9 @@ class AsyncGraph:
         if not props:
             return entity
 
-        set_parts = ", ".join(
-            f"n.`{k}` = {format_cypher_value(v)}" for k, v in props.items()
-        )
-        cypher = f"MATCH (n) WHERE id(n) = {entity.graph_id} SET {set_parts} RETURN n"
+        cypher = _build_update_cypher(entity.graph_id, props)
         await self._execute_cypher(cypher, return_type="vertex")
+        self._db._results.bump(self._name)
 
         entity._dirty.clear()
         dispatch(entity, "post_update", graph=self)
@@ -611,12 +927,10 @@ class AsyncGraph:
 
         dispatch(entity, "pre_delete", graph=self)
 
-        if isinstance(entity, Vertex):
-            cypher = f"MATCH (n) WHERE id(n) = {entity.graph_id} DETACH DELETE n"
-        else:
-            cypher = f"MATCH ()-[e]->() WHERE id(e) = {entity.graph_id} DELETE e"
+        cypher = _build_delete_cypher(entity)
 
         await self._execute_cypher(cypher, return_type="raw")
+        self._db._results.bump(self._name)
         entity._graph_id = None
         entity._db = None
         entity._graph = None
@@ -631,15 +945,14 @@ class AsyncGraph:
             )
 
         dispatch(edge, "pre_add", graph=self)
-        await self.ensure_label(type(edge), kind="e")
 
-        props = model_to_cypher_properties(edge)
-        label = edge.label
-        cypher = (
-            f"MATCH (a), (b) WHERE id(a) = {from_v.graph_id} AND id(b) = {to_v.graph_id} "
-            f"CREATE (a)-[e:{label} {props}]->(b) RETURN e"
+        cypher = _build_connect_cypher(
+            from_v.graph_id, to_v.graph_id, edge.label, model_to_cypher_properties(edge)
         )
-        results = await self._execute_cypher(cypher, return_type="edge")
+        async with self.session() as conn:
+            await self.ensure_label(type(edge), kind="e", conn=conn)
+            results = await self._execute_cypher(cypher, return_type="edge", conn=conn)
+        self._db._results.bump(self._name)
 
         if results:
             edge._graph_id = results[0].get("graph_id")
@@ -666,11 +979,11 @@ class AsyncGraph:
         """
         if not isinstance(data, dict):
             return data
-        if any(k.startswith("col_") for k in data):
+        if "col_0" in data:
             return {k: self._hydrate_result(v) for k, v in data.items()}
         if "label" not in data or "properties" not in data:
             return data
-        model_class = AgeModel._label_registry.get(data["label"])
+        model_class = self._label_registry.get(data["label"])
         if model_class is None:
             return data
         return dict_to_model(data, model_class, db=self._db, graph=self)
@@ -680,6 +993,7 @@ class AsyncGraph:
         statement: str,
         columns: list[str] | None = None,
         return_type: str = "raw",
+        cached: bool = False,
         **params,
     ) -> list:
         """Execute raw Cypher and return results (async).
@@ -691,38 +1005,123 @@ class AsyncGraph:
                 column name (instead of col_0, col_1, ...) and scalar
                 values wrapped in {"value": x} are automatically unwrapped.
             return_type: How to parse results ("vertex", "edge", "raw").
+            cached: Reuse results of an identical earlier read until the next
+                write made through this ORM. Only for read-only statements.
             **params: Parameter values to substitute ($name placeholders).
         """
         results = await self._execute_cypher(
-            statement, params=params, columns=columns, return_type=return_type
+            statement, params=params, columns=columns, return_type=return_type, cached=cached
         )
         hydrated = [self._hydrate_result(r) for r in results]
         if columns:
             return _remap_columns(hydrated, columns)
         return hydrated
 
-    async def ensure_label(self, model_class: type[AgeModel], kind: str = "v") -> None:
+    async def ensure_label(
+        self, model_class: type[AgeModel], kind: str = "v", conn=None, label: str | None = None
+    ) -> None:
         """Ensure a vertex or edge label exists (async)."""
-        label = getattr(model_class, "__label__", None) or model_class.__name__
+        label = label or getattr(model_class, "__label__", None) or model_class.__name__
+        if label in self._known_labels:
+            return
+
+        if conn is None:
+            conn = self._session_conn()
+        if conn is None:
+            async with self._db._pool.connection() as conn:
+                await self._create_label_if_missing(conn, label, kind)
+            self._known_labels.add(label)
+        elif not await self._create_label_if_missing(conn, label, kind):
+            self._known_labels.add(label)
+
+    async def _create_label_if_missing(self, conn, label: str, kind: str) -> bool:
+        """Create label on conn unless it exists (async). Returns True if created."""
+        result = await conn.execute(_LABEL_EXISTS_SQL, (self._name, label), prepare=True)
+        if await result.fetchone() is not None:
+            return False
+
+        await conn.execute(_build_create_label_sql(self._name, label, kind))
+        log.info("Created %s label: %s", "vertex" if kind == "v" else "edge", label)
+        return True
+
+
+# === Statement Builders ===
+# Shared by Graph and AsyncGraph so both emit identical Cypher/SQL.
+
+_LABEL_EXISTS_SQL = (
+    "SELECT 1 FROM information_schema.tables "
+    "WHERE table_schema = %s AND table_name = %s"
+)
 
-        async with self._db._pool.connection() as conn:
-            result = await conn.execute(
-                "SELECT 1 FROM information_schema.tables "
-                "WHERE table_schema = %s AND table_name = %s",
-                (self._name, label),
-            )
-            row = await result.fetchone()
 
-            if row is None:
-                if kind == "v":
-                    await conn.execute(
-                        f"SELECT create_vlabel('{self._name}', '{label}')"
-                    )
-                else:
-                    await conn.execute(
-                        f"SELECT create_elabel('{self._name}', '{label}')"
-                    )
-                log.info("Created %s label: %s", "vertex" if kind == "v" else "edge", label)
+def _build_create_label_sql(graph_name: str, label: str, kind: str) -> str:
+    fn = "create_vlabel" if kind == "v" else "create_elabel"
+    return f"SELECT {fn}('{graph_name}', '{label}')"
+
+
+def _build_create_cypher(label: str, props: str) -> str:
+    return f"CREATE (n:{label} {props}) RETURN n"
+
+
+def _build_update_cypher(graph_id: int, props: dict[str, Any]) -> str:
+    # Backtick-escape names to avoid reserved-word conflicts
+    set_parts = ", ".join(
+        f"n.`{k}` = {format_cypher_value(v)}" for k, v in props.items()
+    )
+    return f"MATCH (n) WHERE id(n) = {graph_id} SET {set_parts} RETURN n"
+
+
+def _build_delete_cypher(entity: Vertex | Edge) -> str:
+    if isinstance(entity, Vertex):
+        return f"MATCH (n) WHERE id(n) = {entity.graph_id} DETACH DELETE n"
+    return f"MATCH ()-[e]->() WHERE id(e) = {entity.graph_id} DELETE e"
+
+
+def _build_connect_cypher(from_id: int, to_id: int, label: str, props: str) -> str:
+    return (
+        f"MATCH (a), (b) WHERE id(a) = {from_id} AND id(b) = {to_id} "
+        f"CREATE (a)-[e:{label} {props}]->(b) RETURN e"
+    )
+
+
+# === SQL Wrapper ===
+
+
+@lru_cache(maxsize=64)
+def _col_clause(columns: tuple[str, ...] | None) -> str:
+    """Build the AS (...) column list, quoting names to avoid reserved words."""
+    if not columns:
+        return "result agtype"
+    return ", ".join(f'"{c}" agtype' for c in columns)
+
+
+@lru_cache(maxsize=64)
+def _sql_template(graph_name: str, col_clause: str, bound: bool) -> tuple[str, str]:
+    """Return the SQL text that goes before and after the Cypher body."""
+    head = f"SELECT * FROM cypher('{graph_name}', $$ "
+    if bound:
+        return head, f" $$, %s) AS ({col_clause})"
+    return head, f" $$) AS ({col_clause})"
+
+
+def _cypher_sql(
+    graph_name: str,
+    cypher: str,
+    columns: list[str] | None,
+    params: dict[str, Any] | None,
+) -> tuple[str, tuple[str] | None]:
+    """Wrap Cypher in AGE's cypher() call, binding params server-side.
+
+    AGE reads $name placeholders from an agtype map passed as the third
+    argument to cypher(), which must be a bare bind parameter. Keeping
+    values out of the text means identical queries share one SQL string.
+    """
+    col_clause = _col_clause(tuple(columns) if columns else None)
+    head, tail = _sql_template(graph_name, col_clause, bool(params))
+    if not params:
+        return head + cypher + tail, None
+    # Literal % would otherwise be read as a psycopg placeholder.
+    return head + cypher.replace("%", "%%") + tail, (to_agtype_properties(params),)
 
 
 # === Column Remapping ===
@@ -768,6 +1167,33 @@ def _remap_columns(hydrated: list, columns: list[str]) -> list:
 
 # === Result Parsing Helpers ===
 
+# AGE type suffixes attached to objects/arrays (e.g., }::edge, ]::path)
+_SUFFIX_OBJ_RE = re.compile(r"([\]}])::\w+")
+# Trailing suffix on scalars (e.g., 42::int, "text"::text)
+_SUFFIX_SCALAR_RE = re.compile(r"::\w+$")
+
+# Interned multi-column result keys; wider results fall back to formatting.
+_COL_NAMES = tuple(sys.intern(f"col_{i}") for i in range(64))
+
+_NUMERIC_CHARS = frozenset("0123456789+-.eE")
+# Non-finite float spellings emitted by AGE
+_SPECIAL_FLOATS = frozenset({"NaN", "Infinity", "-Infinity"})
+
+
+def _strip_agtype_suffixes(val_str: str) -> str:
+    """Remove AGE type suffixes (::vertex, ::edge, ::path, ::numeric, ...).
+
+    The common graph-entity suffixes are removed with plain str.replace;
+    the regexes only run if some other suffix remains.
+    """
+    if "::" not in val_str:
+        return val_str
+    val_str = val_str.replace("}::vertex", "}").replace("}::edge", "}").replace("]::path", "]")
+    if "::" in val_str:
+        val_str = _SUFFIX_OBJ_RE.sub(r"\1", val_str)
+        val_str = _SUFFIX_SCALAR_RE.sub("", val_str)
+    return val_str
+
 
 def _parse_agtype_result(val: Any, return_type: str) -> dict:
     """Parse a single agtype result value into a dict.
@@ -784,21 +1210,21 @@ def _parse_agtype_result(val: Any, return_type: str) -> dict:
     if val is None:
         return {}
 
+    # Pools configured by Database register an agtype loader, so cells
+    # usually arrive already parsed; check for that first.
+    if isinstance(val, dict):
+        return val
+
     # psycopg returns agtype as string if no custom loader is registered
     if isinstance(val, str):
         val_str = val.strip()
 
-        # Strip AGE agtype suffixes (::vertex, ::edge, ::path, ::int, etc.)
-        # First strip suffixes attached to objects/arrays (e.g., }::edge, ]::path)
-        val_str = re.sub(r'([\]}])::\w+', r'\1', val_str)
-        # Then strip a trailing suffix on scalars (e.g., 42::int, "text"::text)
-        val_str = re.sub(r'::\w+$', '', val_str)
-        val_str = val_str.strip()
+        val_str = _strip_agtype_suffixes(val_str).strip()
 
         # JSON object/array/scalar
         if val_str.startswith(("{", "[", '"')) or val_str in ("null", "true", "false"):
             try:
-                parsed = json.loads(val_str)
+                parsed = json_loads(val_str)
                 if isinstance(parsed, dict):
                     # Normalize vertex/edge results: rename 'id' -> 'graph_id'
                     if "id" in parsed and "properties" in parsed:
@@ -813,22 +1239,19 @@ def _parse_agtype_result(val: Any, return_type: str) -> dict:
             except json.JSONDecodeError:
                 pass
 
-        # Numeric
-        try:
-            num = int(val_str)
-            return {"value": num}
-        except ValueError:
+        # Numeric: only attempt conversion on strings that could be numbers,
+        # so arbitrary text doesn't pay for two raised ValueErrors
+        if val_str in _SPECIAL_FLOATS or set(val_str) <= _NUMERIC_CHARS:
             try:
-                num = float(val_str)
-                return {"value": num}
+                return {"value": int(val_str)}
             except ValueError:
-                pass
+                try:
+                    return {"value": float(val_str)}
+                except ValueError:
+                    pass
 
         return {"raw": val_str}
 
-    if isinstance(val, dict):
-        return val
-
     if isinstance(val, (int, float, bool)):
         return {"value": val}
 
@@ -836,18 +1259,39 @@ def _parse_agtype_result(val: Any, return_type: str) -> dict:
     return {"raw": str(val)}
 
 
+def _parse_agtype_bytes(data: bytes) -> dict:
+    """Parse one agtype result cell as received from the server.
+
+    Vertices and edges make up most result cells, so their JSON body is
+    decoded straight from the bytes; anything else takes the text path.
+    """
+    if data.endswith(b"}::vertex"):
+        body = data[:-8]
+    elif data.endswith(b"}::edge"):
+        body = data[:-6]
+    else:
+        return _parse_agtype_result(data.decode(), "raw")
+    try:
+        parsed = json_loads(body)
+    except json.JSONDecodeError:
+        return _parse_agtype_result(data.decode(), "raw")
+    if "id" in parsed and "properties" in parsed:
+        parsed["graph_id"] = parsed.pop("id")
+    return parsed
+
+
 def _parse_result_rows(
     rows: list[tuple], return_type: str, num_columns: int = 1
 ) -> list[dict]:
     """Parse multiple result rows."""
-    results = []
-    for row in rows:
-        if num_columns == 1:
-            parsed = _parse_agtype_result(row[0], return_type)
-            results.append(parsed)
-        else:
-            parsed_row = {}
-            for i, val in enumerate(row):
-                parsed_row[f"col_{i}"] = _parse_agtype_result(val, "raw")
-            results.append(parsed_row)
-    return results
+    if num_columns == 1:
+        return [_parse_agtype_result(row[0], return_type) for row in rows]
+    # Multiple columns, keyed col_0..col_N
+    if num_columns <= len(_COL_NAMES):
+        col_names = _COL_NAMES[:num_columns]
+    else:
+        col_names = tuple(f"col_{i}" for i in range(num_columns))
+    return [
+        dict(zip(col_names, [_parse_agtype_result(val, "raw") for val in row]))
+        for row in rows
+    ]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, ClassVar, Literal, TYPE_CHECKING
+from collections.abc import Callable, Iterable, Iterator, MutableSet
+from types import NoneType, UnionType
+from typing import Any, ClassVar, Literal, TYPE_CHECKING, Union, get_args, get_origin
 
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import PydanticUndefined
 
 from age_orm.exceptions import DetachedInstanceError
 from age_orm.references import Relationship
@@ -12,15 +15,333 @@ from age_orm.references import Relationship
 if TYPE_CHECKING:
     type IncEx = set[int] | set[str] | dict[int, Any] | dict[str, Any] | None
 
-# Internal attributes stored in __dict__ via object.__setattr__, NOT declared
-# as Pydantic fields or private attributes. This avoids Pydantic's
-# __pydantic_private__ mechanism which conflicts with __getattribute__ overrides.
+# Internal attributes stored directly in __dict__, NOT declared as Pydantic
+# fields or private attributes. This avoids Pydantic's __pydantic_private__
+# mechanism, and they are read back as plain attributes.
 _INTERNAL_ATTRS = frozenset({
     "_age_graph_id", "_age_label", "_age_dirty", "_age_db", "_age_graph",
     "_age_fields", "_age_refs", "_age_refs_vals", "_age_relations",
+    "_age_start_id", "_age_end_id",
 })
 
 
+# __setattr__ handlers, chosen once per (class, attribute) by _resolve_setter.
+# All take (self, attr, value) so they can be stored and called uniformly.
+_set_internal = object.__setattr__
+_set_plain = BaseModel.__setattr__
+
+
+def _dirty_setter(bit: int) -> Callable[[Any, str, Any], None]:
+    def _set_data_field(self, attr: str, value: Any) -> None:
+        BaseModel.__setattr__(self, attr, value)
+        self.__dict__["_age_dirty"] |= bit
+
+    return _set_data_field
+
+
+def _resolve_setter(cls: type["AgeModel"], attr: str) -> Callable[[Any, str, Any], None]:
+    if attr in _INTERNAL_ATTRS:
+        return _set_internal
+    if attr.startswith("_") or attr == "model_config":
+        return _set_plain
+    bit = cls._age_field_bits.get(attr)
+    if bit is not None:
+        return _dirty_setter(bit)
+    # Relationship fields and anything pydantic will reject
+    return _set_plain
+
+
+# Models get a generated __init__ specialized to their class (see
+# _build_init). Set to False before defining models to keep the generic
+# AgeModel.__init__, e.g. when stepping through construction in a debugger.
+GENERATE_INIT = True
+
+_INIT_TEMPLATE = """\
+def __init__(self, /, *, _graph_id=None, _label=None, _db=None, _graph=None{extra_args}, **data):
+    if self.__class__ is not _CLS:
+        return _GENERIC(
+            self, _graph_id=_graph_id, _label=_label, _db=_db, _graph=_graph{extra_kwargs}, **data
+        )
+    _BaseModel__init(self, **data)
+    self.__dict__.update({{
+        "_age_fields": _FIELDS,
+        "_age_refs": _REFS,
+        "_age_refs_vals": {{}},
+        "_age_graph_id": _graph_id,
+        "_age_label": _label or _LABEL,
+        "_age_db": _db,
+        "_age_graph": _graph,
+        "_age_relations": {{}},
+        "_age_dirty": 0 if _db is not None else _ALL_BITS,{extra_items}
+    }})
+"""
+
+
+def _build_init(cls: type["AgeModel"], generic: Callable[..., None]) -> Callable[..., None]:
+    """Compile an __init__ for cls with its class-level state baked in.
+
+    Does the same as the generic __init__ it replaces but binds the internal
+    kwargs by name instead of probing **kwargs. Instances of subclasses that
+    reach it through super() are handed back to ``generic``.
+    """
+    extras = cls._age_init_extras
+    src = _INIT_TEMPLATE.format(
+        extra_args="".join(f", _{name}=None" for name in extras),
+        extra_kwargs="".join(f", _{name}=_{name}" for name in extras),
+        extra_items="".join(f'\n        "_age_{name}": _{name},' for name in extras),
+    )
+    namespace: dict[str, Any] = {
+        "_CLS": cls,
+        "_GENERIC": generic,
+        "_BaseModel__init": BaseModel.__init__,
+        "_FIELDS": cls._age_fields_cls,
+        "_REFS": cls._age_refs_cls,
+        "_LABEL": cls.__label__ or cls.__name__,
+        "_ALL_BITS": cls._age_all_bits,
+    }
+    # Source is the fixed template plus the class's own internal kwarg names
+    exec(compile(src, f"<age_init:{cls.__name__}>", "exec"), namespace)  # noqa: S102
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init._age_generic = generic
+    return init
+
+
+# Builds a clean instance straight from a DB row for models that can skip
+# validation (see _build_loader); returns None when a required field is
+# missing so the caller can fall back to the validating constructor.
+_LOAD_TEMPLATE = """\
+def _age_load(data, db, graph):
+    props = data.get("properties", data)
+    try:
+        values = {{{field_items}
+        }}
+    except KeyError:
+        return None
+    self = _NEW(_CLS)
+    values.update({{
+        "_age_fields": _FIELDS,
+        "_age_refs": _REFS,
+        "_age_refs_vals": {{}},
+        "_age_graph_id": data.get("graph_id"),
+        "_age_label": data.get("label", _LABEL),
+        "_age_db": db,
+        "_age_graph": graph,
+        "_age_relations": {{}},
+        "_age_dirty": 0,{extra_items}
+    }})
+    _SET(self, "__dict__", values)
+    _SET(self, "__pydantic_fields_set__", _FIELD_NAMES.intersection(props))
+    _SET(self, "__pydantic_extra__", None)
+    _SET(self, "__pydantic_private__", None)
+    return self
+"""
+
+
+def _build_loader(cls: type["AgeModel"]) -> Callable[..., "AgeModel | None"]:
+    """Compile the DB-row loader for cls with its fields and defaults baked in.
+
+    Produces the same instance as model_construct() followed by the
+    internal-state update in AgeModel._age_from_db, except that relationship
+    fields share their class default instead of a deep copy of it.
+    """
+    defaults = []
+    values = []
+    for fname, finfo in cls._age_fields_cls.items():
+        if finfo.is_required():
+            values.append(f'props["{fname}"]')
+        else:
+            values.append(f'props.get("{fname}", _D[{len(defaults)}])')
+            defaults.append(finfo.default)
+    for finfo in cls._age_refs_cls.values():
+        values.append(f"_D[{len(defaults)}]")
+        defaults.append(finfo.default)
+    names = [*cls._age_fields_cls, *cls._age_refs_cls]
+    src = _LOAD_TEMPLATE.format(
+        field_items="".join(f'\n            "{n}": {v},' for n, v in zip(names, values)),
+        extra_items="".join(
+            f'\n        "_age_{name}": data.get("{name}"),' for name in cls._age_init_extras
+        ),
+    )
+    namespace: dict[str, Any] = {
+        "_CLS": cls,
+        "_NEW": object.__new__,
+        "_SET": object.__setattr__,
+        "_D": tuple(defaults),
+        "_FIELDS": cls._age_fields_cls,
+        "_REFS": cls._age_refs_cls,
+        "_FIELD_NAMES": set(cls._age_fields_cls),
+        "_LABEL": cls.__label__,
+    }
+    # Source is the fixed template plus the class's field names; no row data
+    exec(compile(src, f"<age_load:{cls.__name__}>", "exec"), namespace)  # noqa: S102
+    return namespace["_age_load"]
+
+
+def _can_build_loader(cls: type["AgeModel"]) -> bool:
+    """Whether model_construct() on cls amounts to copying field values over."""
+    if (
+        not cls._age_trusted_load
+        or cls.model_config.get("extra") == "allow"
+        or cls.__private_attributes__
+        or cls.__pydantic_post_init__ is not None
+    ):
+        return False
+    for finfo in cls._age_fields_cls.values():
+        if finfo.default_factory is not None:
+            return False
+        if finfo.default is not PydanticUndefined and type(finfo.default) not in _TRUSTED_TYPES:
+            return False
+    return True
+
+
+# Field types whose values come back from agtype exactly as pydantic would
+# validate them, letting DB rows skip validation (see AgeModel._age_from_db).
+_TRUSTED_TYPES = frozenset({str, int, float, bool, NoneType})
+
+
+def _is_trusted_annotation(annotation: Any) -> bool:
+    if annotation in _TRUSTED_TYPES:
+        return True
+    if get_origin(annotation) in (Union, UnionType):
+        return all(_is_trusted_annotation(arg) for arg in get_args(annotation))
+    return False
+
+
+def _is_trusted_load(cls: type["AgeModel"], fields: dict[str, Any]) -> bool:
+    decorators = cls.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return False
+    # Annotated metadata carries validators and constraints of its own
+    # (BeforeValidator, AfterValidator, MaxLen, ...), which must still run.
+    return all(
+        _is_trusted_annotation(finfo.annotation) and not finfo.metadata and finfo.alias is None
+        for finfo in fields.values()
+    )
+
+
+def _is_plain_dump(cls: type["AgeModel"], fields: dict[str, Any]) -> bool:
+    """Whether model_dump(mode="json") would just return the field values."""
+    decorators = cls.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers or decorators.computed_fields:
+        return False
+    # Annotated metadata (PlainSerializer, WrapSerializer, ...) can change the
+    # dump, so only bare annotations qualify.
+    return all(
+        _is_trusted_annotation(finfo.annotation) and not finfo.metadata and not finfo.exclude
+        for finfo in fields.values()
+    )
+
+
+class _DirtyView(MutableSet):
+    """Set-like view over a model's dirty bitmask.
+
+    Dirty fields are tracked as bits in ``_age_dirty``; this keeps the old
+    ``_dirty`` set interface (membership, iteration, ``clear()``) working on
+    top of it.
+    """
+
+    __slots__ = ("_model",)
+
+    def __init__(self, model: "AgeModel"):
+        self._model = model
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[str]) -> set[str]:
+        return set(it)
+
+    def __contains__(self, name: object) -> bool:
+        bit = type(self._model)._age_field_bits.get(name)  # type: ignore[arg-type]
+        return bit is not None and bool(self._model.__dict__["_age_dirty"] & bit)
+
+    def __iter__(self) -> Iterator[str]:
+        dirty = self._model.__dict__["_age_dirty"]
+        return (name for name, bit in type(self._model)._age_field_bits.items() if dirty & bit)
+
+    def __len__(self) -> int:
+        return self._model.__dict__["_age_dirty"].bit_count()
+
+    def add(self, name: str) -> None:
+        self._model.__dict__["_age_dirty"] |= type(self._model)._age_field_bits[name]
+
+    def discard(self, name: str) -> None:
+        bit = type(self._model)._age_field_bits.get(name)
+        if bit is not None:
+            self._model.__dict__["_age_dirty"] &= ~bit
+
+    def clear(self) -> None:
+        self._model.__dict__["_age_dirty"] = 0
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class _RelationshipDescriptor:
+    """Lazy loader installed on the class for each relationship field.
+
+    Being a data descriptor, it takes precedence over the default value
+    pydantic stores in the instance __dict__, so relationship reads land
+    here while ordinary field reads never touch Python-level code.
+    """
+
+    __slots__ = ("name", "relationship")
+
+    def __init__(self, name: str, relationship: Relationship):
+        self.name = name
+        self.relationship = relationship
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            # Hide from class-level getattr so pydantic doesn't take the
+            # descriptor for a field default when collecting subclass fields.
+            raise AttributeError(self.name)
+
+        # Return cached or lazy-load
+        d = instance.__dict__
+        refs_vals = d.get("_age_refs_vals")
+        if refs_vals is None:
+            # Built without the ORM's internal state (e.g. model_construct()),
+            # so there is nothing to load from: the field looks absent.
+            raise AttributeError(self.name)
+        if self.name in refs_vals:
+            return refs_vals[self.name]
+
+        db = d.get("_age_db")
+        graph = d.get("_age_graph")
+        if db is None or graph is None:
+            raise DetachedInstanceError(
+                f"Cannot load relationship '{self.name}': entity is not bound to a "
+                "database/graph. Save the entity first or pass _db and _graph."
+            )
+
+        relationship = self.relationship
+        cypher = relationship.build_cypher(d["_age_graph_id"])
+        results = graph._execute_cypher(cypher, return_type="vertex")
+
+        from age_orm.utils.serialization import dict_to_model
+
+        target_class = relationship.resolve_target_class()
+        models = [dict_to_model(r, target_class, db=db, graph=graph) for r in results]
+
+        if relationship.uselist:
+            r_val = models
+        else:
+            r_val = models[0] if models else None
+
+        if relationship.cache:
+            refs_vals[self.name] = r_val
+
+        return r_val
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self.name] = value
+
+
 class AgeModel(BaseModel):
     """Base for all graph entities (vertices and edges)."""
 
@@ -32,195 +353,232 @@ class AgeModel(BaseModel):
 
     __label__: ClassVar[str | None] = None
     _label_registry: ClassVar[dict[str, type["AgeModel"]]] = {}
+    # Class __name__ and __qualname__ -> class, for resolving relationship targets.
+    _class_registry: ClassVar[dict[str, type["AgeModel"]]] = {}
+
+    # Class-invariant field partitioning, computed once per subclass in
+    # __pydantic_init_subclass__ and shared by all instances.
+    _age_fields_cls: ClassVar[dict[str, Any]] = {}
+    _age_refs_cls: ClassVar[dict[str, Any]] = {}
+    # field name -> dirty bit, and the mask with every data field set.
+    _age_field_bits: ClassVar[dict[str, int]] = {}
+    _age_all_bits: ClassVar[int] = 0
+    _age_exclude_fields: ClassVar[frozenset[str]] = frozenset()
+    # Whether DB rows can be loaded without validation, and the fields
+    # such a row must contain to do so.
+    _age_trusted_load: ClassVar[bool] = False
+    _age_required_fields: ClassVar[frozenset[str]] = frozenset()
+    # Generated loader used by _age_from_db (see _build_loader), or None.
+    _age_load: ClassVar[Callable[..., "AgeModel | None"] | None] = None
+    # Whether the JSON dump of a model is its data fields read as they are.
+    _age_plain_dump: ClassVar[bool] = False
+    # Extra internal kwargs accepted by __init__: "_x" is stored as "_age_x".
+    _age_init_extras: ClassVar[tuple[str, ...]] = ()
+    # attr -> __setattr__ handler, filled in lazily per subclass.
+    _age_setters: ClassVar[dict[str, Callable[[Any, str, Any], None]]] = {}
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
+        AgeModel._class_registry[cls.__name__] = cls
+        AgeModel._class_registry[cls.__qualname__] = cls
         label = getattr(cls, "__label__", None)
         if label is not None:
             AgeModel._label_registry[label] = cls
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        # Runs once pydantic has collected model_fields (unlike __init_subclass__)
+        super().__pydantic_init_subclass__(**kwargs)
 
         # Separate data fields from relationship fields
         fields = {}
         refs = {}
-        for fname, finfo in type(self).model_fields.items():
+        for fname, finfo in cls.model_fields.items():
             if finfo.default.__class__ is Relationship:
                 refs[fname] = finfo
                 continue
             fields[fname] = finfo
+        cls._age_fields_cls = fields
+        cls._age_refs_cls = refs
+        cls._age_field_bits = {fname: 1 << i for i, fname in enumerate(fields)}
+        cls._age_all_bits = (1 << len(fields)) - 1
+        cls._age_exclude_fields = frozenset(refs)
+        cls._age_trusted_load = _is_trusted_load(cls, fields)
+        cls._age_plain_dump = _is_plain_dump(cls, fields)
+        cls._age_required_fields = frozenset(
+            fname for fname, finfo in fields.items() if finfo.is_required()
+        )
+        cls._age_setters = {}
+        for fname, finfo in refs.items():
+            setattr(cls, fname, _RelationshipDescriptor(fname, finfo.default))
+        cls._age_load = staticmethod(_build_loader(cls)) if _can_build_loader(cls) else None
+
+        # Only replace __init__ where it would otherwise resolve to a generic
+        # one; a user-defined __init__ is left alone.
+        if GENERATE_INIT:
+            init = cls.__init__
+            generic = getattr(init, "_age_generic", None)
+            if generic is not None:
+                cls.__init__ = _build_init(cls, generic)  # type: ignore[method-assign]
 
-        # Store internal state directly in __dict__, bypassing Pydantic
-        _set = object.__setattr__
-        _set(self, "_age_fields", fields)
-        _set(self, "_age_refs", refs)
-        _set(self, "_age_refs_vals", {})
-        _set(self, "_age_graph_id", kwargs.get("_graph_id", None))
-        _set(self, "_age_label", kwargs.get("_label", None) or self.__label__ or type(self).__name__)
-        _set(self, "_age_db", kwargs.get("_db", None))
-        _set(self, "_age_graph", kwargs.get("_graph", None))
-        _set(self, "_age_relations", {})
-
-        # Dirty tracking: new objects start fully dirty, DB-loaded objects start clean
-        if kwargs.get("_db") is not None:
-            _set(self, "_age_dirty", set())
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        cls = type(self)
+
+        # Store internal state directly in __dict__, bypassing Pydantic. A
+        # single update with a fixed key order keeps instance dicts uniform.
+        db = kwargs.get("_db", None)
+        self.__dict__.update({
+            "_age_fields": cls._age_fields_cls,
+            "_age_refs": cls._age_refs_cls,
+            "_age_refs_vals": {},
+            "_age_graph_id": kwargs.get("_graph_id", None),
+            "_age_label": kwargs.get("_label", None) or cls.__label__ or cls.__name__,
+            "_age_db": db,
+            "_age_graph": kwargs.get("_graph", None),
+            "_age_relations": {},
+            # New objects start fully dirty, DB-loaded objects start clean
+            "_age_dirty": 0 if db is not None else cls._age_all_bits,
+        })
+
+    # Marks the generic __init__ (and, via _build_init, generated ones) as
+    # safe to replace with a class-specialized version.
+    __init__._age_generic = __init__  # type: ignore[attr-defined]
+
+    @classmethod
+    def _age_from_db(cls, data: dict, db=None, graph=None, validate: bool = False) -> "AgeModel":
+        """Build a clean instance from a parsed result row.
+
+        Models whose fields are all plain JSON scalars get their properties
+        installed without validation: they were validated when written and
+        agtype hands them back unchanged. Most such models have a generated
+        loader for this (_age_load). Anything else goes through the normal
+        constructor, as does every row when validate is true.
+        """
+        if not validate and cls._age_load is not None:
+            instance = cls._age_load(data, db, graph)
+            if instance is not None:
+                return instance
+        props = data.get("properties", data)
+        if not validate and cls._age_trusted_load and cls._age_required_fields.issubset(props):
+            instance = cls.model_construct(**props)
         else:
-            _set(self, "_age_dirty", set(fields.keys()))
-
-    def __str__(self):
-        return f"{type(self).__name__}({super().__str__()})"
+            instance = cls(**props)
+        d = instance.__dict__
+        d.update({
+            "_age_fields": cls._age_fields_cls,
+            "_age_refs": cls._age_refs_cls,
+            "_age_refs_vals": {},
+            "_age_graph_id": data.get("graph_id"),
+            "_age_label": data.get("label", cls.__label__),
+            "_age_db": db,
+            "_age_graph": graph,
+            "_age_relations": {},
+            "_age_dirty": 0,
+        })
+        for name in cls._age_init_extras:
+            if name in data:
+                d[f"_age_{name}"] = data[name]
+            else:
+                d.setdefault(f"_age_{name}", None)
+        return instance
 
     def __repr__(self):
-        return self.__str__()
-
-    def __setattr__(self, attr: str, value: Any):
-        if attr in _INTERNAL_ATTRS:
-            object.__setattr__(self, attr, value)
-            return
-        super().__setattr__(attr, value)
-        if attr.startswith("_") or attr == "model_config":
-            return
-        refs = object.__getattribute__(self, "_age_refs")
-        dirty = object.__getattribute__(self, "_age_dirty")
-        if attr in type(self).model_fields and attr not in refs:
-            dirty.add(attr)
-
-    def __getattribute__(self, item: str):
-        # Fast path for truly internal attrs stored in __dict__
-        if item in _INTERNAL_ATTRS:
-            return object.__getattribute__(self, item)
-
-        # Fast path for private/dunder/model_ attributes
-        if item.startswith("_") or item.startswith("model_"):
-            return super().__getattribute__(item)
-
-        # Check if this is a relationship field
-        try:
-            refs = object.__getattribute__(self, "_age_refs")
-        except AttributeError:
-            # Model not fully initialized yet
-            return super().__getattribute__(item)
-
-        if item not in refs:
-            return super().__getattribute__(item)
-
-        # Item is a relationship — return cached or lazy-load
-        refs_vals = object.__getattribute__(self, "_age_refs_vals")
-        if item in refs_vals:
-            return refs_vals[item]
-
-        db = object.__getattribute__(self, "_age_db")
-        graph = object.__getattribute__(self, "_age_graph")
-        if db is None or graph is None:
-            raise DetachedInstanceError(
-                f"Cannot load relationship '{item}': entity is not bound to a database/graph. "
-                "Save the entity first or pass _db and _graph."
-            )
-
-        relationship: Relationship = refs[item].default
-        target_class = relationship.resolve_target_class()
-        target_label = getattr(target_class, "__label__", None) or target_class.__name__
-
-        graph_id = object.__getattribute__(self, "_age_graph_id")
-        dir_left = "<" if relationship.direction == "inbound" else ""
-        dir_right = ">" if relationship.direction == "outbound" else ""
-
-        depth_str = f"*1..{relationship.depth}" if relationship.depth > 1 else ""
-        cypher = (
-            f"MATCH (n){dir_left}-[:{relationship.edge_label}{depth_str}]-{dir_right}(m:{target_label}) "
-            f"WHERE id(n) = {graph_id} RETURN m"
+        # Data fields only, read straight from __dict__: relationship fields
+        # are skipped so printing a model never triggers a lazy load.
+        cls = type(self)
+        d = self.__dict__
+        body = ", ".join(
+            f"{name}={d.get(name)!r}" for name, finfo in cls._age_fields_cls.items() if finfo.repr
         )
+        return f"{cls.__name__}({body})"
 
-        results = graph._execute_cypher(cypher, return_type="vertex")
-
-        from age_orm.utils.serialization import dict_to_model
-
-        models = [dict_to_model(r, target_class, db=db, graph=graph) for r in results]
-
-        if relationship.uselist:
-            r_val = models
-        else:
-            r_val = models[0] if models else None
+    __str__ = __repr__
 
-        if relationship.cache:
-            refs_vals[item] = r_val
-
-        return r_val
+    def __setattr__(self, attr: str, value: Any):
+        cls = type(self)
+        setter = cls._age_setters.get(attr)
+        if setter is None:
+            setter = cls._age_setters[attr] = _resolve_setter(cls, attr)
+        setter(self, attr, value)
 
     @property
     def graph_id(self) -> int | None:
         """AGE internal graph ID (read-only after creation)."""
-        return object.__getattribute__(self, "_age_graph_id")
+        return self._age_graph_id
 
     @property
     def label(self) -> str:
         """The AGE label for this entity."""
-        return object.__getattribute__(self, "_age_label") or self.__label__ or type(self).__name__
+        return self._age_label or self.__label__ or type(self).__name__
 
     @property
     def is_dirty(self) -> bool:
-        return len(object.__getattribute__(self, "_age_dirty")) > 0
+        return self._age_dirty != 0
 
     @property
     def _label(self) -> str | None:
-        return object.__getattribute__(self, "_age_label")
+        return self._age_label
 
     @_label.setter
     def _label(self, value: str | None):
-        object.__setattr__(self, "_age_label", value)
+        self.__dict__["_age_label"] = value
 
     @property
-    def _dirty(self) -> set[str]:
-        return object.__getattribute__(self, "_age_dirty")
+    def _dirty(self) -> _DirtyView:
+        return _DirtyView(self)
 
     @_dirty.setter
-    def _dirty(self, value: set[str]):
-        object.__setattr__(self, "_age_dirty", value)
+    def _dirty(self, value: Iterable[str]):
+        bits = type(self)._age_field_bits
+        mask = 0
+        for name in value:
+            mask |= bits[name]
+        self.__dict__["_age_dirty"] = mask
 
     @property
     def _graph_id(self) -> int | None:
-        return object.__getattribute__(self, "_age_graph_id")
+        return self._age_graph_id
 
     @_graph_id.setter
     def _graph_id(self, value: int | None):
-        object.__setattr__(self, "_age_graph_id", value)
+        self.__dict__["_age_graph_id"] = value
 
     @property
     def _db(self):
-        return object.__getattribute__(self, "_age_db")
+        return self._age_db
 
     @_db.setter
     def _db(self, value):
-        object.__setattr__(self, "_age_db", value)
+        self.__dict__["_age_db"] = value
 
     @property
     def _graph(self):
-        return object.__getattribute__(self, "_age_graph")
+        return self._age_graph
 
     @_graph.setter
     def _graph(self, value):
-        object.__setattr__(self, "_age_graph", value)
+        self.__dict__["_age_graph"] = value
 
     @property
     def _relations(self) -> dict:
-        return object.__getattribute__(self, "_age_relations")
+        return self._age_relations
 
     @_relations.setter
     def _relations(self, value: dict):
-        object.__setattr__(self, "_age_relations", value)
+        self.__dict__["_age_relations"] = value
 
     @property
     def _fields(self) -> dict:
-        return object.__getattribute__(self, "_age_fields")
+        return self._age_fields
 
     @property
     def _refs(self) -> dict:
-        return object.__getattribute__(self, "_age_refs")
+        return self._age_refs
 
     @property
     def _refs_vals(self) -> dict:
-        return object.__getattribute__(self, "_age_refs_vals")
+        return self._age_refs_vals
 
     def model_dump(
         self,
@@ -236,17 +594,13 @@ class AgeModel(BaseModel):
         warnings: bool = True,
     ) -> dict[str, Any]:
         # Always exclude relationship fields
-        fields = object.__getattribute__(self, "_age_fields")
-        exclude_fields: set[str] = set()
-        for fname in type(self).model_fields:
-            if fname not in fields:
-                exclude_fields.add(fname)
-
-        if exclude:
-            exclude = set(exclude)  # type: ignore
-            exclude.update(exclude_fields)
-        else:
-            exclude = exclude_fields
+        exclude_fields = type(self)._age_exclude_fields
+        if exclude_fields:
+            if exclude:
+                exclude = set(exclude)  # type: ignore
+                exclude.update(exclude_fields)
+            else:
+                exclude = exclude_fields  # type: ignore
 
         return super().model_dump(
             mode=mode,
@@ -262,6 +616,16 @@ class AgeModel(BaseModel):
 
     def dirty_fields_dump(self, mode: str = "json") -> dict[str, Any]:
         """Return only the dirty (modified) fields as a dict."""
-        all_props = self.model_dump(mode=mode)
-        dirty = object.__getattribute__(self, "_age_dirty")
-        return {k: v for k, v in all_props.items() if k in dirty}
+        dirty = self._age_dirty
+        if not dirty:
+            return {}
+        cls = type(self)
+        if cls._age_plain_dump:
+            # Field values are their own dump in either mode: read them as is.
+            d = self.__dict__
+            return {name: d[name] for name, bit in cls._age_field_bits.items() if dirty & bit}
+        # Serialize just the dirty fields rather than dumping and filtering.
+        # Relationship fields never carry a dirty bit, so there is nothing to
+        # exclude and pydantic's model_dump can be called directly.
+        include = {name for name, bit in cls._age_field_bits.items() if dirty & bit}
+        return super().model_dump(mode=mode, include=include)
@@ -18,34 +18,39 @@ class Edge(AgeModel):
     """
 
     __label__: ClassVar[str | None] = None
+    _age_init_extras: ClassVar[tuple[str, ...]] = ("start_id", "end_id")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        object.__setattr__(self, "_age_start_id", kwargs.get("_start_id", None))
-        object.__setattr__(self, "_age_end_id", kwargs.get("_end_id", None))
+        self.__dict__.update({
+            "_age_start_id": kwargs.get("_start_id", None),
+            "_age_end_id": kwargs.get("_end_id", None),
+        })
+
+    __init__._age_generic = __init__  # type: ignore[attr-defined]
 
     @property
     def start_id(self) -> int | None:
         """Source vertex graph ID."""
-        return object.__getattribute__(self, "_age_start_id")
+        return self._age_start_id
 
     @property
     def end_id(self) -> int | None:
         """Target vertex graph ID."""
-        return object.__getattribute__(self, "_age_end_id")
+        return self._age_end_id
 
     @property
     def _start_id(self) -> int | None:
-        return object.__getattribute__(self, "_age_start_id")
+        return self._age_start_id
 
     @_start_id.setter
     def _start_id(self, value: int | None):
-        object.__setattr__(self, "_age_start_id", value)
+        self.__dict__["_age_start_id"] = value
 
     @property
     def _end_id(self) -> int | None:
-        return object.__getattribute__(self, "_age_end_id")
+        return self._age_end_id
 
     @_end_id.setter
     def _end_id(self, value: int | None):
-        object.__setattr__(self, "_age_end_id", value)
+        self.__dict__["_age_end_id"] = value
@@ -3,15 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Generic, Iterator, TypeVar, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Generic, Iterator, Self, TypeVar, TYPE_CHECKING
 
 from age_orm.exceptions import EntityNotFoundError, MultipleResultsError
 from age_orm.models.base import AgeModel
-from age_orm.utils.serialization import (
-    dict_to_model,
-    format_cypher_value,
-    substitute_cypher_params,
-)
+from age_orm.utils.serialization import dict_to_model
 
 if TYPE_CHECKING:
     from age_orm.graph import Graph, AsyncGraph
@@ -21,34 +18,89 @@ log = logging.getLogger(__name__)
 T = TypeVar("T", bound=AgeModel)
 
 
-class Query(Generic[T]):
-    """Fluent Cypher query builder for synchronous graph operations.
+# Values are bound as $params, so the Cypher text depends only on the query's
+# shape; the same shapes recur constantly and are rendered once.
 
-    Usage:
-        people = graph.query(Person).filter("n.age > $min_age", min_age=20).sort("n.name").all()
-        alice = graph.query(Person).filter_by(name="Alice").one()
+
+@lru_cache(maxsize=512)
+def _render_match_where(label: str, filters: tuple[str, ...]) -> str:
+    """Render the MATCH + WHERE lines of a query."""
+    if filters:
+        return f"MATCH (n:{label})\nWHERE {' '.join(filters)}"
+    return f"MATCH (n:{label})"
+
+
+@lru_cache(maxsize=512)
+def _render_cypher(
+    label: str,
+    filters: tuple[str, ...],
+    return_fields: tuple[str, ...] | None,
+    sort_columns: tuple[str, ...],
+    skip: int,
+    limit: int | None,
+) -> str:
+    """Render a full query from its structure."""
+    parts = [_render_match_where(label, filters)]
+
+    # RETURN
+    if return_fields:
+        parts.append(f"RETURN {', '.join(return_fields)}")
+    else:
+        parts.append("RETURN n")
+
+    # ORDER BY
+    if sort_columns:
+        parts.append(f"ORDER BY {', '.join(sort_columns)}")
+
+    # SKIP
+    if skip > 0:
+        parts.append(f"SKIP {skip}")
+
+    # LIMIT
+    if limit is not None:
+        parts.append(f"LIMIT {limit}")
+
+    return "\n".join(parts)
+
+
+class _QueryBuilderBase(Generic[T]):
+    """Query state and the fluent builder methods shared by Query and AsyncQuery.
+
+    Subclasses add execution against a sync or async graph.
     """
 
-    def __init__(self, model_class: type[T], graph: "Graph"):
+    __slots__ = (
+        "_bind_vars",
+        "_cached",
+        "_filters",
+        "_graph",
+        "_label",
+        "_limit",
+        "_model_class",
+        "_return_fields",
+        "_skip",
+        "_sort_columns",
+    )
+
+    def __init__(self, model_class: type[T], graph: Any):
         self._model_class = model_class
         self._graph = graph
         self._label = getattr(model_class, "__label__", None) or model_class.__name__
-        self._filters: list[dict] = []
+        # WHERE clause pieces, each already prefixed with its AND/OR joiner
+        self._filters: list[str] = []
         self._sort_columns: list[str] = []
         self._limit: int | None = None
         self._skip: int = 0
         self._return_fields: list[str] | None = None
         self._bind_vars: dict[str, Any] = {}
+        self._cached = False
 
     def __str__(self) -> str:
         return self._build_cypher()
 
-    def __iter__(self) -> Iterator[T]:
-        return self.iterator()
-
     # === Filtering ===
 
-    def filter(self, condition: str, _or: bool = False, **kwargs) -> "Query[T]":
+    def filter(self, condition: str, _or: bool = False, **kwargs) -> Self:
         """Add a filter condition.
 
         Conditions use 'n' as the variable name for the matched node.
@@ -57,15 +109,9 @@ class Query(Generic[T]):
         Example:
             query.filter("n.age > $min_age AND n.name <> $excluded", min_age=20, excluded="Bob")
         """
-        joiner = None
-        if self._filters:
-            joiner = "OR" if _or else "AND"
-
-        self._filters.append({"condition": condition, "joiner": joiner})
-        self._bind_vars.update(kwargs)
-        return self
+        return self._add_filter(condition, _or, kwargs)
 
-    def filter_by(self, _or: bool = False, **kwargs) -> "Query[T]":
+    def filter_by(self, _or: bool = False, **kwargs) -> Self:
         """Convenience filter for equality conditions.
 
         Example:
@@ -79,18 +125,11 @@ class Query(Generic[T]):
         condition = " AND ".join(conditions)
         if len(conditions) > 1:
             condition = f"({condition})"
-
-        joiner = None
-        if self._filters:
-            joiner = "OR" if _or else "AND"
-
-        self._filters.append({"condition": condition, "joiner": joiner})
-        self._bind_vars.update(kwargs)
-        return self
+        return self._add_filter(condition, _or, kwargs)
 
     # === Sorting / Limiting ===
 
-    def sort(self, field: str) -> "Query[T]":
+    def sort(self, field: str) -> Self:
         """Add a sort clause.
 
         Use 'n.' prefix for the node variable. Append ' DESC' for descending.
@@ -102,13 +141,13 @@ class Query(Generic[T]):
         self._sort_columns.append(field)
         return self
 
-    def limit(self, count: int, skip: int = 0) -> "Query[T]":
+    def limit(self, count: int, skip: int = 0) -> Self:
         """Set limit and optional skip (offset)."""
         self._limit = count
         self._skip = skip
         return self
 
-    def returns(self, *fields: str) -> "Query[T]":
+    def returns(self, *fields: str) -> Self:
         """Specify which fields to return (projections).
 
         Example:
@@ -117,30 +156,101 @@ class Query(Generic[T]):
         self._return_fields = list(fields)
         return self
 
+    def cached(self, enabled: bool = True) -> Self:
+        """Serve reads from the database's result cache.
+
+        Cached results are reused until the next write made through the ORM.
+        """
+        self._cached = enabled
+        return self
+
+    # === Internal ===
+
+    def _add_filter(self, condition: str, _or: bool, bind_vars: dict[str, Any]) -> Self:
+        if self._filters:
+            condition = f"{'OR' if _or else 'AND'} {condition}"
+        self._filters.append(condition)
+        self._bind_vars.update(bind_vars)
+        return self
+
+    def _update_cypher(self, values: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Build the SET statement for update() and its parameters.
+
+        New values are bound as $_set_<field> so they can't collide with
+        the filter's own bind vars.
+        """
+        set_parts = ", ".join(f"n.{k} = $_set_{k}" for k in values)
+        cypher = f"{self._build_match_where()}\nSET {set_parts}\nRETURN count(n)"
+        params = dict(self._bind_vars)
+        params.update({f"_set_{k}": v for k, v in values.items()})
+        return cypher, params
+
+    def _one_limit(self) -> int:
+        """LIMIT for one(): two rows are enough to tell one result from many."""
+        return 2 if self._limit is None else min(self._limit, 2)
+
+    def _build_match_where(self) -> str:
+        """Build the MATCH + WHERE portion of the Cypher query."""
+        return _render_match_where(self._label, tuple(self._filters))
+
+    def _build_cypher(self, limit: int | None = None) -> str:
+        """Build the full Cypher query string, optionally overriding the limit."""
+        return _render_cypher(
+            self._label,
+            tuple(self._filters),
+            tuple(self._return_fields) if self._return_fields else None,
+            tuple(self._sort_columns),
+            self._skip,
+            self._limit if limit is None else limit,
+        )
+
+
+class Query(_QueryBuilderBase[T]):
+    """Fluent Cypher query builder for synchronous graph operations.
+
+    Usage:
+        people = graph.query(Person).filter("n.age > $min_age", min_age=20).sort("n.name").all()
+        alice = graph.query(Person).filter_by(name="Alice").one()
+    """
+
+    __slots__ = ()
+
+    _graph: "Graph"
+
+    def __iter__(self) -> Iterator[T]:
+        return self.iterator()
+
     # === Execution ===
 
     def all(self) -> list[T]:
         """Execute query and return all matching entities."""
         return list(self.iterator())
 
+    def all_dicts(self) -> list[dict]:
+        """Execute query and return the parsed rows without building models.
+
+        Each row is a dict with label, graph_id and properties keys. There is
+        no dirty tracking or relationship loading; use this when the caller
+        only needs the data (e.g. to serialize it straight away).
+        """
+        return self._graph._execute_cypher(
+            self._build_cypher(), params=self._bind_vars, return_type="vertex", cached=self._cached
+        )
+
     def first(self) -> T | None:
         """Return the first matching entity, or None."""
-        original_limit = self._limit
-        self._limit = 1
-        results = self.all()
-        self._limit = original_limit
-        return results[0] if results else None
+        return next(self._iterate(self._build_cypher(limit=1)), None)
 
     def one(self) -> T:
         """Return exactly one matching entity. Raises if not exactly one result."""
-        results = self.all()
+        results = list(self._iterate(self._build_cypher(limit=self._one_limit())))
         if len(results) == 0:
             raise EntityNotFoundError(
                 f"No {self._model_class.__name__} found matching query"
             )
         if len(results) > 1:
             raise MultipleResultsError(
-                f"Expected 1 {self._model_class.__name__}, got {len(results)}"
+                f"Expected 1 {self._model_class.__name__}, got more than one"
             )
         return results[0]
 
@@ -148,15 +258,21 @@ class Query(Generic[T]):
         """Return the count of matching entities."""
         cypher = self._build_match_where()
         cypher += "\nRETURN count(n)"
-        results = self._graph._execute_cypher(cypher, return_type="raw")
+        results = self._graph._execute_cypher(
+            cypher, params=self._bind_vars, return_type="raw", cached=self._cached
+        )
         if results and "value" in results[0]:
             return results[0]["value"]
         return 0
 
     def iterator(self) -> Iterator[T]:
         """Execute query and yield results one at a time."""
-        cypher = self._build_cypher()
-        results = self._graph._execute_cypher(cypher, return_type="vertex")
+        return self._iterate(self._build_cypher())
+
+    def _iterate(self, cypher: str) -> Iterator[T]:
+        results = self._graph._execute_cypher(
+            cypher, params=self._bind_vars, return_type="vertex", cached=self._cached
+        )
 
         for r in results:
             yield dict_to_model(
@@ -167,10 +283,10 @@ class Query(Generic[T]):
 
     def by_id(self, graph_id: int) -> T | None:
         """Look up an entity by its AGE graph ID."""
-        cypher = (
-            f"MATCH (n:{self._label}) WHERE id(n) = {graph_id} RETURN n"
+        cypher = f"MATCH (n:{self._label}) WHERE id(n) = $graph_id RETURN n"
+        results = self._graph._execute_cypher(
+            cypher, params={"graph_id": graph_id}, return_type="vertex", cached=self._cached
         )
-        results = self._graph._execute_cypher(cypher, return_type="vertex")
         if results:
             return dict_to_model(
                 results[0], self._model_class, db=self._graph._db, graph=self._graph
@@ -179,12 +295,10 @@ class Query(Generic[T]):
 
     def by_property(self, field: str, value: Any) -> T | None:
         """Look up an entity by a single property value."""
-        cypher = (
-            f"MATCH (n:{self._label}) "
-            f"WHERE n.{field} = {format_cypher_value(value)} "
-            f"RETURN n"
+        cypher = f"MATCH (n:{self._label}) WHERE n.{field} = $value RETURN n"
+        results = self._graph._execute_cypher(
+            cypher, params={"value": value}, return_type="vertex", cached=self._cached
         )
-        results = self._graph._execute_cypher(cypher, return_type="vertex")
         if results:
             return dict_to_model(
                 results[0], self._model_class, db=self._graph._db, graph=self._graph
@@ -195,12 +309,9 @@ class Query(Generic[T]):
 
     def update(self, **kwargs) -> int:
         """Update all matching entities with the given values. Returns count updated."""
-        match_where = self._build_match_where()
-        set_parts = ", ".join(
-            f"n.{k} = {format_cypher_value(v)}" for k, v in kwargs.items()
-        )
-        cypher = f"{match_where}\nSET {set_parts}\nRETURN count(n)"
-        results = self._graph._execute_cypher(cypher, return_type="raw")
+        cypher, params = self._update_cypher(kwargs)
+        results = self._graph._execute_cypher(cypher, params=params, return_type="raw")
+        self._graph._db._results.bump(self._graph.name)
         if results and "value" in results[0]:
             return results[0]["value"]
         return 0
@@ -208,11 +319,13 @@ class Query(Generic[T]):
     def delete(self) -> int:
         """Delete all matching entities. Returns count deleted."""
         match_where = self._build_match_where()
-        cypher = f"{match_where}\nDETACH DELETE n"
-        # DELETE doesn't return count in AGE, so we count first
-        count = self.count()
-        self._graph._execute_cypher(cypher, return_type="raw")
-        return count
+        # Deleted vertices can still be returned, so count them in the same statement
+        cypher = f"{match_where}\nDETACH DELETE n\nRETURN count(n)"
+        results = self._graph._execute_cypher(cypher, params=self._bind_vars, return_type="raw")
+        self._graph._db._results.bump(self._graph.name)
+        if results and "value" in results[0]:
+            return results[0]["value"]
+        return 0
 
     # === Raw Cypher ===
 
@@ -220,144 +333,53 @@ class Query(Generic[T]):
         """Execute a raw Cypher query with the current collection binding."""
         return self._graph.cypher(statement, **kwargs)
 
-    # === Internal ===
 
-    def _build_match_where(self) -> str:
-        """Build the MATCH + WHERE portion of the Cypher query."""
-        cypher = f"MATCH (n:{self._label})"
-
-        # WHERE clauses
-        if self._filters:
-            where_parts = []
-            for fc in self._filters:
-                if fc["joiner"] is None:
-                    where_parts.append(fc["condition"])
-                else:
-                    where_parts.append(f"{fc['joiner']} {fc['condition']}")
-
-            where_clause = " ".join(where_parts)
-            # Substitute bind vars
-            where_clause = substitute_cypher_params(where_clause, self._bind_vars)
-            cypher += f"\nWHERE {where_clause}"
-
-        return cypher
-
-    def _build_cypher(self) -> str:
-        """Build the full Cypher query string."""
-        cypher = self._build_match_where()
-
-        # RETURN
-        if self._return_fields:
-            cypher += f"\nRETURN {', '.join(self._return_fields)}"
-        else:
-            cypher += "\nRETURN n"
-
-        # ORDER BY
-        if self._sort_columns:
-            cypher += f"\nORDER BY {', '.join(self._sort_columns)}"
-
-        # SKIP
-        if self._skip > 0:
-            cypher += f"\nSKIP {self._skip}"
-
-        # LIMIT
-        if self._limit is not None:
-            cypher += f"\nLIMIT {self._limit}"
-
-        return cypher
-
-
-class AsyncQuery(Generic[T]):
+class AsyncQuery(_QueryBuilderBase[T]):
     """Fluent Cypher query builder for async graph operations.
 
     Same interface as Query but with async execution methods.
     """
 
-    def __init__(self, model_class: type[T], graph: "AsyncGraph"):
-        self._model_class = model_class
-        self._graph = graph
-        self._label = getattr(model_class, "__label__", None) or model_class.__name__
-        self._filters: list[dict] = []
-        self._sort_columns: list[str] = []
-        self._limit: int | None = None
-        self._skip: int = 0
-        self._return_fields: list[str] | None = None
-        self._bind_vars: dict[str, Any] = {}
-
-    def __str__(self) -> str:
-        return self._build_cypher()
-
-    # === Filtering (sync — returns self) ===
-
-    def filter(self, condition: str, _or: bool = False, **kwargs) -> "AsyncQuery[T]":
-        """Add a filter condition."""
-        joiner = None
-        if self._filters:
-            joiner = "OR" if _or else "AND"
-        self._filters.append({"condition": condition, "joiner": joiner})
-        self._bind_vars.update(kwargs)
-        return self
-
-    def filter_by(self, _or: bool = False, **kwargs) -> "AsyncQuery[T]":
-        """Convenience filter for equality conditions."""
-        if not kwargs:
-            return self
-        conditions = [f"n.{k} = ${k}" for k in kwargs]
-        condition = " AND ".join(conditions)
-        if len(conditions) > 1:
-            condition = f"({condition})"
-        joiner = None
-        if self._filters:
-            joiner = "OR" if _or else "AND"
-        self._filters.append({"condition": condition, "joiner": joiner})
-        self._bind_vars.update(kwargs)
-        return self
-
-    def sort(self, field: str) -> "AsyncQuery[T]":
-        """Add a sort clause."""
-        self._sort_columns.append(field)
-        return self
+    __slots__ = ()
 
-    def limit(self, count: int, skip: int = 0) -> "AsyncQuery[T]":
-        """Set limit and optional skip."""
-        self._limit = count
-        self._skip = skip
-        return self
-
-    def returns(self, *fields: str) -> "AsyncQuery[T]":
-        """Specify fields to return."""
-        self._return_fields = list(fields)
-        return self
+    _graph: "AsyncGraph"
 
     # === Async Execution ===
 
     async def all(self) -> list[T]:
         """Execute query and return all matching entities."""
-        cypher = self._build_cypher()
-        results = await self._graph._execute_cypher(cypher, return_type="vertex")
+        return await self._fetch(self._build_cypher())
+
+    async def _fetch(self, cypher: str) -> list[T]:
+        results = await self._graph._execute_cypher(
+            cypher, params=self._bind_vars, return_type="vertex", cached=self._cached
+        )
         return [
             dict_to_model(r, self._model_class, db=self._graph._db, graph=self._graph)
             for r in results
         ]
 
+    async def all_dicts(self) -> list[dict]:
+        """Execute query and return the parsed rows without building models."""
+        return await self._graph._execute_cypher(
+            self._build_cypher(), params=self._bind_vars, return_type="vertex", cached=self._cached
+        )
+
     async def first(self) -> T | None:
         """Return first matching entity or None."""
-        original_limit = self._limit
-        self._limit = 1
-        results = await self.all()
-        self._limit = original_limit
+        results = await self._fetch(self._build_cypher(limit=1))
         return results[0] if results else None
 
     async def one(self) -> T:
         """Return exactly one matching entity."""
-        results = await self.all()
+        results = await self._fetch(self._build_cypher(limit=self._one_limit()))
         if len(results) == 0:
             raise EntityNotFoundError(
                 f"No {self._model_class.__name__} found matching query"
             )
         if len(results) > 1:
             raise MultipleResultsError(
-                f"Expected 1 {self._model_class.__name__}, got {len(results)}"
+                f"Expected 1 {self._model_class.__name__}, got more than one"
             )
         return results[0]
 
@@ -365,15 +387,19 @@ class AsyncQuery(Generic[T]):
         """Return the count of matching entities."""
         cypher = self._build_match_where()
         cypher += "\nRETURN count(n)"
-        results = await self._graph._execute_cypher(cypher, return_type="raw")
+        results = await self._graph._execute_cypher(
+            cypher, params=self._bind_vars, return_type="raw", cached=self._cached
+        )
         if results and "value" in results[0]:
             return results[0]["value"]
         return 0
 
     async def by_id(self, graph_id: int) -> T | None:
         """Look up by AGE graph ID."""
-        cypher = f"MATCH (n:{self._label}) WHERE id(n) = {graph_id} RETURN n"
-        results = await self._graph._execute_cypher(cypher, return_type="vertex")
+        cypher = f"MATCH (n:{self._label}) WHERE id(n) = $graph_id RETURN n"
+        results = await self._graph._execute_cypher(
+            cypher, params={"graph_id": graph_id}, return_type="vertex", cached=self._cached
+        )
         if results:
             return dict_to_model(
                 results[0], self._model_class, db=self._graph._db, graph=self._graph
@@ -382,12 +408,10 @@ class AsyncQuery(Generic[T]):
 
     async def by_property(self, field: str, value: Any) -> T | None:
         """Look up by single property value."""
-        cypher = (
-            f"MATCH (n:{self._label}) "
-            f"WHERE n.{field} = {format_cypher_value(value)} "
-            f"RETURN n"
+        cypher = f"MATCH (n:{self._label}) WHERE n.{field} = $value RETURN n"
+        results = await self._graph._execute_cypher(
+            cypher, params={"value": value}, return_type="vertex", cached=self._cached
         )
-        results = await self._graph._execute_cypher(cypher, return_type="vertex")
         if results:
             return dict_to_model(
                 results[0], self._model_class, db=self._graph._db, graph=self._graph
@@ -396,55 +420,21 @@ class AsyncQuery(Generic[T]):
 
     async def update(self, **kwargs) -> int:
         """Update all matching entities."""
-        match_where = self._build_match_where()
-        set_parts = ", ".join(
-            f"n.{k} = {format_cypher_value(v)}" for k, v in kwargs.items()
-        )
-        cypher = f"{match_where}\nSET {set_parts}\nRETURN count(n)"
-        results = await self._graph._execute_cypher(cypher, return_type="raw")
+        cypher, params = self._update_cypher(kwargs)
+        results = await self._graph._execute_cypher(cypher, params=params, return_type="raw")
+        self._graph._db._results.bump(self._graph.name)
         if results and "value" in results[0]:
             return results[0]["value"]
         return 0
 
     async def delete(self) -> int:
         """Delete all matching entities."""
-        count = await self.count()
         match_where = self._build_match_where()
-        cypher = f"{match_where}\nDETACH DELETE n"
-        await self._graph._execute_cypher(cypher, return_type="raw")
-        return count
-
-    # === Internal ===
-
-    def _build_match_where(self) -> str:
-        cypher = f"MATCH (n:{self._label})"
-        if self._filters:
-            where_parts = []
-            for fc in self._filters:
-                if fc["joiner"] is None:
-                    where_parts.append(fc["condition"])
-                else:
-                    where_parts.append(f"{fc['joiner']} {fc['condition']}")
-            where_clause = " ".join(where_parts)
-            where_clause = substitute_cypher_params(where_clause, self._bind_vars)
-            cypher += f"\nWHERE {where_clause}"
-        return cypher
-
-    def _build_cypher(self) -> str:
-        cypher = self._build_match_where()
-
-        if self._return_fields:
-            cypher += f"\nRETURN {', '.join(self._return_fields)}"
-        else:
-            cypher += "\nRETURN n"
-
-        if self._sort_columns:
-            cypher += f"\nORDER BY {', '.join(self._sort_columns)}"
-
-        if self._skip > 0:
-            cypher += f"\nSKIP {self._skip}"
-
-        if self._limit is not None:
-            cypher += f"\nLIMIT {self._limit}"
-
-        return cypher
+        cypher = f"{match_where}\nDETACH DELETE n\nRETURN count(n)"
+        results = await self._graph._execute_cypher(
+            cypher, params=self._bind_vars, return_type="raw"
+        )
+        self._graph._db._results.bump(self._graph.name)
+        if results and "value" in results[0]:
+            return results[0]["value"]
+        return 0
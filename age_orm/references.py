@@ -18,6 +18,19 @@ class Relationship:
             friends: list["Person"] = relationship("Person", "KNOWS")
     """
 
+    __slots__ = (
+        "_cypher_template",
+        "_target_class",
+        "_target_label",
+        "cache",
+        "depth",
+        "dir_left",
+        "dir_right",
+        "direction",
+        "edge_label",
+        "uselist",
+    )
+
     def __init__(
         self,
         target_class: type["AgeModel"] | str,
@@ -33,18 +46,50 @@ class Relationship:
         self.uselist = uselist
         self.cache = cache
         self.depth = depth
+        # Arrow heads for the MATCH pattern
+        self.dir_left = "<" if direction == "inbound" else ""
+        self.dir_right = ">" if direction == "outbound" else ""
+        # Lazy-load MATCH statement, built on first use (see build_cypher)
+        self._cypher_template: str | None = None
+        self._target_label: str | None = None
 
     def resolve_target_class(self) -> type["AgeModel"]:
         """Resolve string class reference to actual class."""
         if isinstance(self._target_class, str):
-            resolved = locate(self._target_class)
+            name = self._target_class
+            if "." in name:
+                resolved = locate(name)
+            else:
+                # Bare names refer to a model label or class name
+                from age_orm.models.base import AgeModel
+
+                resolved = AgeModel._label_registry.get(name) or AgeModel._class_registry.get(name)
             if resolved is None:
                 raise ImportError(
                     f"Cannot resolve relationship target class: {self._target_class!r}"
                 )
             self._target_class = resolved
+        if self._target_label is None:
+            target_class = self._target_class
+            self._target_label = getattr(target_class, "__label__", None) or target_class.__name__
         return self._target_class
 
+    def build_cypher(self, graph_id: int) -> str:
+        """Return the MATCH statement loading this relationship from graph_id."""
+        template = self._cypher_template
+        if template is None:
+            self.resolve_target_class()
+            depth_str = f"*1..{self.depth}" if self.depth > 1 else ""
+            template = (
+                f"MATCH (n){self.dir_left}-[:{self.edge_label}{depth_str}]-{self.dir_right}"
+                f"(m:{self._target_label}) WHERE id(n) = {{graph_id}} RETURN m"
+            )
+            if not self.uselist:
+                # Only the first match is used
+                template += " LIMIT 1"
+            self._cypher_template = template
+        return template.format_map({"graph_id": graph_id})
+
 
 def relationship(
     target_class: type["AgeModel"] | str,
@@ -57,7 +102,8 @@ def relationship(
     """Define a graph relationship for lazy loading.
 
     Args:
-        target_class: The target vertex model class (or fully qualified name string).
+        target_class: The target vertex model class, its label or class name,
+            or a fully qualified name string.
         edge_label: The AGE edge label to traverse.
         direction: "outbound", "inbound", or "any".
         uselist: If True, returns a list. If False, returns a single instance or None.
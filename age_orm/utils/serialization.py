@@ -4,14 +4,38 @@ from __future__ import annotations
 
 import json
 import re
+from json.encoder import c_make_encoder, encode_basestring
+from functools import lru_cache
+from collections.abc import Callable, Iterable, Iterator
+from types import NoneType
 from typing import Any, TypeVar, TYPE_CHECKING
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install age-orm[fast]
+    orjson = None
+
 if TYPE_CHECKING:
     from age_orm.models.base import AgeModel
 
 T = TypeVar("T", bound="AgeModel")
 
 
+def json_loads(s: str) -> Any:
+    """Decode JSON text, using orjson when it is installed.
+
+    Falls back to the stdlib parser for input orjson rejects but json accepts
+    (e.g. NaN/Infinity, which AGE emits for special float values).
+    Raises json.JSONDecodeError on invalid input either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
+
 def escape_agtype_string(s: str) -> str:
     """Escape a string for use inside an agtype JSON value.
 
@@ -20,21 +44,9 @@ def escape_agtype_string(s: str) -> str:
     """
     if s is None:
         return ""
-    s = str(s)
-    s = s.replace("\\", "\\\\")
-    s = s.replace('"', '\\"')
-    s = s.replace("\n", "\\n")
-    s = s.replace("\r", "\\r")
-    s = s.replace("\t", "\\t")
-    # Escape remaining control characters
-    result = []
-    for c in s:
-        code = ord(c)
-        if code < 0x20 and c not in "\n\r\t":
-            result.append(f"\\u{code:04x}")
-        else:
-            result.append(c)
-    return "".join(result)
+    # The C JSON string encoder escapes exactly this set in one pass; only
+    # its surrounding quotes need dropping.
+    return encode_basestring(str(s))[1:-1]
 
 
 def escape_sql_literal(s: str) -> str:
@@ -42,61 +54,160 @@ def escape_sql_literal(s: str) -> str:
     return s.replace("'", "''")
 
 
+def _agtype_null(val: None) -> str:
+    return "null"
+
+
+def _agtype_bool(val: bool) -> str:
+    return "true" if val else "false"
+
+
+# agtype maps and lists are JSON text, so the C encoder does the work; the
+# separators match the recursive formatting below. Special floats are
+# refused so they keep to_agtype_value's spelling (nan, inf).
+_json_encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(", ", ": "))
+if c_make_encoder is not None:
+    # JSONEncoder.encode builds a fresh C encoder on every call; build it once.
+    # No circular-reference markers: property values are trees.
+    _c_encode = c_make_encoder(
+        None, _json_encoder.default, encode_basestring, None, ": ", ", ", False, False, False
+    )
+
+    def _json_encode(val: Any) -> str:
+        return "".join(_c_encode(val, 0))
+
+else:  # interpreters without the C accelerator
+    _json_encode = _json_encoder.encode
+
+
+# The C string escaper behind the encoder, called directly so a plain
+# string skips JSONEncoder.encode's Python-level type checks.
+_agtype_str: Callable[[str], str] = encode_basestring
+
+
+def _agtype_list(val: list) -> str:
+    try:
+        return _json_encode(val)
+    except (TypeError, ValueError):
+        # Values JSON can't encode as-is (dates, nan, ...)
+        items = ", ".join([to_agtype_value(v) for v in val])
+        return f"[{items}]"
+
+
+def _agtype_dict(val: dict) -> str:
+    try:
+        return _json_encode(val)
+    except (TypeError, ValueError):
+        items = ", ".join([f"{_json_encode(str(k))}: {to_agtype_value(v)}" for k, v in val.items()])
+        return "{" + items + "}"
+
+
+# Exact-type formatters, looked up before falling back to isinstance checks
+# for subclasses and other types.
+_AGTYPE_DISPATCH: dict[type, Callable[[Any], str]] = {
+    NoneType: _agtype_null,
+    bool: _agtype_bool,
+    int: str,
+    float: str,
+    str: _agtype_str,
+    list: _agtype_list,
+    dict: _agtype_dict,
+}
+
+
 def to_agtype_value(val: Any) -> str:
     """Convert a Python value to an agtype-compatible string representation."""
-    if val is None:
-        return "null"
-    elif isinstance(val, bool):
-        return "true" if val else "false"
-    elif isinstance(val, int):
-        return str(val)
-    elif isinstance(val, float):
+    fn = _AGTYPE_DISPATCH.get(type(val))
+    if fn is not None:
+        return fn(val)
+    if isinstance(val, bool):
+        return _agtype_bool(val)
+    elif isinstance(val, (int, float)):
         return str(val)
     elif isinstance(val, str):
-        return f'"{escape_agtype_string(val)}"'
+        return _agtype_str(val)
     elif isinstance(val, list):
-        items = ", ".join(to_agtype_value(v) for v in val)
-        return f"[{items}]"
+        return _agtype_list(val)
     elif isinstance(val, dict):
-        items = ", ".join(f'"{k}": {to_agtype_value(v)}' for k, v in val.items())
-        return "{" + items + "}"
+        return _agtype_dict(val)
     else:
-        return f'"{escape_agtype_string(str(val))}"'
+        return _agtype_str(str(val))
 
 
 def to_agtype_properties(props: dict) -> str:
     """Convert a properties dict to an agtype object string: {key: value, ...}."""
-    items = ", ".join(f'"{k}": {to_agtype_value(v)}' for k, v in props.items())
+    return _agtype_dict(props)
+
+
+def _cypher_str(val: str) -> str:
+    if "'" in val or "\\" in val:
+        val = val.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{val}'"
+
+
+# Formatters for values that never contain other values.
+_CYPHER_SCALARS: dict[type, Callable[[Any], str]] = {
+    NoneType: _agtype_null,
+    bool: _agtype_bool,
+    int: str,
+    float: str,
+    str: _cypher_str,
+}
+
+
+# Leaves of nested values are formatted through _CYPHER_SCALARS directly,
+# saving a format_cypher_value frame per element; only nested containers
+# and unusual types recurse.
+def _cypher_list(val: list) -> str:
+    scalars = _CYPHER_SCALARS
+    items = ", ".join([
+        fn(v) if (fn := scalars.get(type(v))) is not None else format_cypher_value(v)
+        for v in val
+    ])
+    return f"[{items}]"
+
+
+def _cypher_dict(val: dict) -> str:
+    scalars = _CYPHER_SCALARS
+    items = ", ".join([
+        f"{k}: {fn(v) if (fn := scalars.get(type(v))) is not None else format_cypher_value(v)}"
+        for k, v in val.items()
+    ])
     return "{" + items + "}"
 
 
+_CYPHER_DISPATCH: dict[type, Callable[[Any], str]] = {
+    **_CYPHER_SCALARS,
+    list: _cypher_list,
+    dict: _cypher_dict,
+}
+
+
 def format_cypher_value(val: Any) -> str:
     """Format a Python value for safe inline use in a Cypher query string.
 
-    AGE's Cypher doesn't support $param bind variables natively,
-    so values must be safely interpolated into the Cypher text.
+    Queries run through Graph.cypher() bind $params server-side; this is
+    for the statements that still inline their values (the create, update
+    and connect statements built by Graph, and substitute_cypher_params).
     """
-    if val is None:
-        return "null"
-    elif isinstance(val, bool):
-        return "true" if val else "false"
-    elif isinstance(val, int):
-        return str(val)
-    elif isinstance(val, float):
+    fn = _CYPHER_DISPATCH.get(type(val))
+    if fn is not None:
+        return fn(val)
+    if isinstance(val, bool):
+        return _agtype_bool(val)
+    elif isinstance(val, (int, float)):
         return str(val)
     elif isinstance(val, str):
-        escaped = val.replace("\\", "\\\\").replace("'", "\\'")
-        return f"'{escaped}'"
+        return _cypher_str(val)
     elif isinstance(val, list):
-        items = ", ".join(format_cypher_value(v) for v in val)
-        return f"[{items}]"
+        return _cypher_list(val)
     elif isinstance(val, dict):
-        items = ", ".join(
-            f"{k}: {format_cypher_value(v)}" for k, v in val.items()
-        )
-        return "{" + items + "}"
+        return _cypher_dict(val)
     else:
-        return format_cypher_value(str(val))
+        return _cypher_str(str(val))
+
+
+_PARAM_RE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
 
 
 def substitute_cypher_params(cypher: str, params: dict[str, Any] | None) -> str:
@@ -105,20 +216,69 @@ def substitute_cypher_params(cypher: str, params: dict[str, Any] | None) -> str:
     Parameters are referenced as $name in Cypher and replaced with safely
     formatted literal values.
     """
-    if not params:
+    if not params or "$" not in cypher:
         return cypher
-    result = cypher
-    # Sort by key length descending to avoid partial replacements
-    for key in sorted(params.keys(), key=len, reverse=True):
-        pattern = re.compile(r"\$" + re.escape(key) + r"(?![a-zA-Z0-9_])")
-        result = pattern.sub(format_cypher_value(params[key]), result)
-    return result
+
+    # One scan over the text; each match is a whole placeholder name, so
+    # $name is never mistaken for a prefix of $name_suffix.
+    def replace(m: re.Match[str]) -> str:
+        key = m.group(1)
+        return format_cypher_value(params[key]) if key in params else m.group(0)
+
+    return _PARAM_RE.sub(replace, cypher)
+
+
+def _dump_json(model: "AgeModel", include: set[str] | None = None) -> dict[str, Any]:
+    """model_dump(mode="json") straight through the pydantic-core serializer.
+
+    Skips BaseModel.model_dump's Python wrapper; relationship fields are
+    excluded the same way AgeModel.model_dump does.
+    """
+    cls = type(model)
+    return cls.__pydantic_serializer__.to_python(
+        model, mode="json", include=include, exclude=cls._age_exclude_fields or None
+    )
 
 
 def model_to_agtype(model: "AgeModel") -> str:
     """Serialize a model's properties to an agtype string."""
-    props = model.model_dump(mode="json")
-    return to_agtype_properties(props)
+    cls = type(model)
+    if cls._age_plain_dump:
+        # As in model_to_cypher_properties: fill a per-class template from
+        # __dict__, formatting each value directly.
+        template, fields = _agtype_template(cls)
+        d = model.__dict__
+        return template.format(*[to_agtype_value(d[f]) for f in fields])
+    return to_agtype_properties(_dump_json(model))
+
+
+@lru_cache(maxsize=256)
+def _agtype_template(cls: type["AgeModel"]) -> tuple[str, tuple[str, ...]]:
+    """Agtype map template with one {} slot per data field."""
+    fields = tuple(cls._age_fields_cls)
+    return "{{" + ", ".join([f"{_agtype_str(f)}: {{}}" for f in fields]) + "}}", fields
+
+
+def _dump_json_many(models: Iterable["AgeModel"]) -> Iterator[dict[str, Any]]:
+    """_dump_json over many models, looking up the serializer once per class."""
+    cls = None
+    to_python = exclude = None
+    for model in models:
+        if type(model) is not cls:
+            cls = type(model)
+            to_python = cls.__pydantic_serializer__.to_python
+            exclude = cls._age_exclude_fields or None
+        yield to_python(model, mode="json", exclude=exclude)
+
+
+def models_to_agtype(models: Iterable["AgeModel"]) -> list[str]:
+    """Serialize many models' properties to agtype strings (see model_to_agtype)."""
+    return [model_to_agtype(model) for model in models]
+
+
+def models_to_cypher_properties(models: Iterable["AgeModel"]) -> list[str]:
+    """Serialize many models as inline Cypher maps (see model_to_cypher_properties)."""
+    return [_cypher_dict(props) for props in _dump_json_many(models)]
 
 
 def model_to_cypher_properties(model: "AgeModel", only: set[str] | None = None) -> str:
@@ -126,36 +286,77 @@ def model_to_cypher_properties(model: "AgeModel", only: set[str] | None = None)
 
     If `only` is given, only include those field names.
     """
-    props = model.model_dump(mode="json")
-    if only:
-        props = {k: v for k, v in props.items() if k in only}
-    items = ", ".join(f"{k}: {format_cypher_value(v)}" for k, v in props.items())
-    return "{" + items + "}"
+    cls = type(model)
+    if cls._age_plain_dump:
+        # Field values are their own JSON dump, so fill a per-class template
+        # straight from __dict__ instead of calling the serializer.
+        template, fields = _cypher_template(cls, frozenset(only) if only else None)
+        d = model.__dict__
+        return template.format(*[format_cypher_value(d[f]) for f in fields])
+    return _cypher_dict(_dump_json(model, include=only or None))
+
+
+@lru_cache(maxsize=256)
+def _cypher_template(
+    cls: type["AgeModel"], only: frozenset[str] | None
+) -> tuple[str, tuple[str, ...]]:
+    """Inline Cypher map template with one {} slot per (selected) data field."""
+    fields = tuple(f for f in cls._age_fields_cls if only is None or f in only)
+    # The map's own braces are doubled so str.format leaves them alone
+    return "{{" + ", ".join([f"{f}: {{}}" for f in fields]) + "}}", fields
 
 
 # --- Agtype result parsing ---
 
-_AGTYPE_VERTEX_RE = re.compile(
-    r"""(\w+)\[(\d+\.\d+)\]\{(.*)\}""", re.DOTALL
-)
-_AGTYPE_EDGE_RE = re.compile(
-    r"""(\w+)\[(\d+\.\d+)\]\[(\d+\.\d+),(\d+\.\d+)\]\{(.*)\}""", re.DOTALL
+# Label[graphid]{props} for vertices, Label[graphid][start,end]{props} for
+# edges. Surrounding whitespace is absorbed by the pattern, and the props
+# group keeps its braces so it can be handed to the JSON parser as is.
+# The id digits are matched ASCII-only; labels keep Unicode \w since they
+# default to Python class names.
+_AGTYPE_ELEMENT_RE = re.compile(
+    r"\s*(\w+)\[(?a:(\d+)\.(\d+)\](?:\[(\d+)\.(\d+),(\d+)\.(\d+)\])?)(\{.*\})\s*\Z",
+    re.DOTALL,
 )
 
 
+def parse_agtype_element(agtype_str: str) -> dict:
+    """Parse an agtype vertex or edge string into a dict.
+
+    Returns dict with keys: label, graph_id, properties, plus start_id and
+    end_id for edges.
+    """
+    m = _AGTYPE_ELEMENT_RE.match(agtype_str)
+    if not m:
+        raise ValueError(f"Cannot parse agtype element: {agtype_str!r}")
+    return _element_from_match(m)
+
+
+def _element_from_match(m: re.Match[str]) -> dict:
+    # Ids are captured as the digit runs either side of the dot; the graph id
+    # is their concatenation, so joining them avoids a str.replace per id.
+    label, id_hi, id_lo, start_hi, start_lo, end_hi, end_lo, props_str = m.groups()
+    # Property-less elements are common (edges especially); skip the parser
+    props = {} if props_str == "{}" else json_loads(props_str)
+    if start_hi is None:
+        return {"label": label, "graph_id": int(id_hi + id_lo), "properties": props}
+    return {
+        "label": label,
+        "graph_id": int(id_hi + id_lo),
+        "start_id": int(start_hi + start_lo),
+        "end_id": int(end_hi + end_lo),
+        "properties": props,
+    }
+
+
 def parse_agtype_vertex(agtype_str: str) -> dict:
     """Parse an agtype vertex string like: Label[graphid]{props} into a dict.
 
     Returns dict with keys: label, graph_id, properties.
     """
-    m = _AGTYPE_VERTEX_RE.match(agtype_str.strip())
-    if not m:
+    m = _AGTYPE_ELEMENT_RE.match(agtype_str)
+    if not m or m.group(4) is not None:
         raise ValueError(f"Cannot parse agtype vertex: {agtype_str!r}")
-    label = m.group(1)
-    graph_id = m.group(2)
-    props_str = m.group(3)
-    props = json.loads("{" + props_str + "}") if props_str.strip() else {}
-    return {"label": label, "graph_id": int(graph_id.replace(".", "")), "properties": props}
+    return _element_from_match(m)
 
 
 def parse_agtype_edge(agtype_str: str) -> dict:
@@ -163,37 +364,20 @@ def parse_agtype_edge(agtype_str: str) -> dict:
 
     Returns dict with keys: label, graph_id, start_id, end_id, properties.
     """
-    m = _AGTYPE_EDGE_RE.match(agtype_str.strip())
-    if not m:
+    m = _AGTYPE_ELEMENT_RE.match(agtype_str)
+    if not m or m.group(4) is None:
         raise ValueError(f"Cannot parse agtype edge: {agtype_str!r}")
-    label = m.group(1)
-    graph_id = m.group(2)
-    start_id = m.group(3)
-    end_id = m.group(4)
-    props_str = m.group(5)
-    props = json.loads("{" + props_str + "}") if props_str.strip() else {}
-    return {
-        "label": label,
-        "graph_id": int(graph_id.replace(".", "")),
-        "start_id": int(start_id.replace(".", "")),
-        "end_id": int(end_id.replace(".", "")),
-        "properties": props,
-    }
+    return _element_from_match(m)
 
 
-def dict_to_model(data: dict, model_class: type[T], db=None, graph=None) -> T:
+def dict_to_model(
+    data: dict, model_class: type[T], db=None, graph=None, validate: bool = False
+) -> T:
     """Hydrate a model instance from a properties dict.
 
     Sets internal fields (_graph_id, _db, _graph) and marks the instance as clean.
+    Rows of JSON-scalar models skip validation unless validate is true.
     """
-    instance = model_class(**data.get("properties", data))
-    instance._graph_id = data.get("graph_id")
-    instance._label = data.get("label", getattr(model_class, "__label__", None))
-    instance._dirty = set()
-    instance._db = db
-    instance._graph = graph
-    if "start_id" in data:
-        instance._start_id = data["start_id"]
-    if "end_id" in data:
-        instance._end_id = data["end_id"]
-    return instance
+    return model_class._age_from_db(  # type: ignore[return-value]
+        data, db=db, graph=graph, validate=validate
+    )
@@ -1,6 +1,10 @@
 """Tests for Database class (unit-level, no real DB connection needed for these)."""
 
+import pytest
+from psycopg.adapt import AdaptersMap
+
 from age_orm.database import Database, AsyncDatabase
+from age_orm.exceptions import GraphExistsError, GraphNotFoundError
 
 
 class TestDatabaseInit:
@@ -38,3 +42,316 @@ class TestDatabaseInterface:
         methods = ["graph", "create_graph", "drop_graph", "graph_exists", "list_graphs", "close"]
         for method in methods:
             assert hasattr(AsyncDatabase, method), f"AsyncDatabase missing method: {method}"
+
+
+AGTYPE_OID = 16385
+
+
+class FakeConnection:
+    """Records executed SQL and answers graph-existence lookups."""
+
+    def __init__(self, graphs):
+        self.graphs = graphs
+        self.executed = []
+        self._row = None
+        self._rows = None
+        self.cypher_rows = [("1",)]
+        self.adapters = AdaptersMap()
+
+    def execute(self, sql, params=None, prepare=None):
+        self.executed.append(sql)
+        name = params[0] if params else None
+        self._rows = None
+        if "cypher(" in sql:
+            self._rows = self.cypher_rows
+        elif "create_graph" in sql:
+            self._row = None if name in self.graphs else ("",)
+            self.graphs.add(name)
+        elif "drop_graph" in sql:
+            self._row = ("",) if name in self.graphs else None
+            self.graphs.discard(name)
+        elif "ag_graph" in sql:
+            self._row = (name in self.graphs,)
+        elif "regtype" in sql:
+            self._row = (AGTYPE_OID,)
+        return self
+
+    def fetchone(self):
+        return self._row
+
+    def fetchall(self):
+        if self._rows is not None:
+            return list(self._rows)
+        return sorted(self.graphs)
+
+    def cursor(self, row_factory=None):
+        return self
+
+
+class FakePool:
+    """Minimal stand-in for psycopg_pool.ConnectionPool."""
+
+    def __init__(self, graphs=()):
+        self.conn = FakeConnection(set(graphs))
+        self.checkouts = 0
+
+    def connection(self):
+        pool = self
+
+        class _Ctx:
+            def __enter__(self):
+                pool.checkouts += 1
+                return pool.conn
+
+            def __exit__(self, *args):
+                return False
+
+        return _Ctx()
+
+
+def make_db(graphs=(), **kwargs):
+    db = Database("postgresql://fake", open=False, **kwargs)
+    db._pool = FakePool(graphs)
+    return db
+
+
+class TestGraphRoundTrips:
+    """Graph management should check out one connection per call."""
+
+    def test_create_graph_single_statement(self):
+        db = make_db()
+        db.create_graph("g")
+        assert db._pool.checkouts == 1
+        assert len(db._pool.conn.executed) == 1
+        assert "create_graph" in db._pool.conn.executed[0]
+
+    def test_create_existing_graph_raises(self):
+        db = make_db(graphs={"g"})
+        with pytest.raises(GraphExistsError):
+            db.create_graph("g")
+        assert len(db._pool.conn.executed) == 1
+
+    def test_drop_graph_single_statement(self):
+        db = make_db(graphs={"g"})
+        db.drop_graph("g")
+        assert db._pool.checkouts == 1
+        assert len(db._pool.conn.executed) == 1
+
+    def test_drop_missing_graph_raises(self):
+        db = make_db()
+        with pytest.raises(GraphNotFoundError):
+            db.drop_graph("g")
+
+    def test_drop_graph_if_exists(self):
+        db = make_db(graphs={"g"})
+        assert db.drop_graph_if_exists("g")
+        assert not db.drop_graph_if_exists("g")
+        assert db._pool.checkouts == 2
+        assert len(db._pool.conn.executed) == 2
+
+    def test_graph_create_existing_returns_handle(self):
+        db = make_db(graphs={"g"})
+        g = db.graph("g", create=True)
+        assert g.name == "g"
+        assert db._pool.checkouts == 1
+
+    def test_list_graphs(self):
+        db = make_db(graphs={"a", "b"})
+        assert db.list_graphs() == ["a", "b"]
+        assert db._pool.checkouts == 1
+
+
+class TestGraphExistsCache:
+    def test_repeated_lookups_hit_cache(self):
+        db = make_db(graphs={"g"})
+        assert db.graph_exists("g")
+        assert db.graph_exists("g")
+        db.graph("g")
+        assert db._pool.checkouts == 1
+
+    def test_negative_lookups_cached(self):
+        db = make_db()
+        assert not db.graph_exists("missing")
+        assert not db.graph_exists("missing")
+        assert db._pool.checkouts == 1
+
+    def test_create_and_drop_update_cache(self):
+        db = make_db()
+        assert not db.graph_exists("g")
+        db.create_graph("g")
+        assert db.graph_exists("g")
+        db.drop_graph("g")
+        assert not db.graph_exists("g")
+
+    def test_invalidate_cache(self):
+        db = make_db(graphs={"g"})
+        assert db.graph_exists("g")
+        db.invalidate_cache("g")
+        db._pool.conn.graphs.discard("g")
+        assert not db.graph_exists("g")
+        assert db._pool.checkouts == 2
+
+    def test_ttl_expiry(self):
+        db = make_db(graphs={"g"}, metadata_ttl=0)
+        assert db.graph_exists("g")
+        assert db.graph_exists("g")
+        assert db._pool.checkouts == 2
+
+    def test_list_graphs_cached_until_ddl(self):
+        db = make_db(graphs={"a"})
+        assert db.list_graphs() == ["a"]
+        assert db.list_graphs() == ["a"]
+        assert db._pool.checkouts == 1
+        db.create_graph("b")
+        assert db.list_graphs() == ["a", "b"]
+        assert db._pool.checkouts == 3
+
+
+class TestResultCache:
+    def test_cached_read_served_from_cache(self):
+        db = make_db(graphs={"g"})
+        g = db.graph("g")
+        first = g.cypher("MATCH (n) RETURN count(n)", cached=True)
+        second = g.cypher("MATCH (n) RETURN count(n)", cached=True)
+        assert first == second == [{"value": 1}]
+        cypher_calls = [sql for sql in db._pool.conn.executed if "cypher(" in sql]
+        assert len(cypher_calls) == 1
+
+    def test_uncached_by_default(self):
+        db = make_db(graphs={"g"})
+        g = db.graph("g")
+        g.cypher("MATCH (n) RETURN count(n)")
+        g.cypher("MATCH (n) RETURN count(n)")
+        assert sum("cypher(" in sql for sql in db._pool.conn.executed) == 2
+
+    def test_returned_results_are_copies(self):
+        db = make_db(graphs={"g"})
+        g = db.graph("g")
+        g.cypher("RETURN 1", cached=True)[0]["value"] = 99
+        assert g.cypher("RETURN 1", cached=True) == [{"value": 1}]
+
+    def test_write_invalidates(self):
+        from tests.conftest import Person
+
+        db = make_db(graphs={"g"})
+        g = db.graph("g")
+        g.cypher("MATCH (n) RETURN count(n)", cached=True)
+        person = Person(name="Alice", age=30, _db=object())
+        person._graph_id = 1
+        person.age = 31
+        g.update(person)
+        db._pool.conn.cypher_rows = [("2",)]
+        assert g.cypher("MATCH (n) RETURN count(n)", cached=True) == [{"value": 2}]
+
+    def test_lru_bound(self):
+        db = make_db(graphs={"g"}, result_cache_size=1)
+        g = db.graph("g")
+        g.cypher("RETURN 1", cached=True)
+        g.cypher("RETURN 2", cached=True)
+        g.cypher("RETURN 1", cached=True)
+        assert sum("cypher(" in sql for sql in db._pool.conn.executed) == 3
+
+
+class TestConfigureConnection:
+    def test_setup_is_single_statement(self):
+        from age_orm.database import _configure_age_connection
+
+        conn = FakeConnection(set())
+        conn.autocommit = False
+        _configure_age_connection(conn)
+        assert len(conn.executed) == 1
+        assert "LOAD 'age'" in conn.executed[0]
+        assert "search_path" in conn.executed[0]
+        assert conn.autocommit is False
+
+    def test_registers_agtype_loader(self):
+        from age_orm.database import _AgtypeLoader, _configure_age_connection
+
+        conn = FakeConnection(set())
+        conn.autocommit = False
+        _configure_age_connection(conn)
+        assert conn.adapters.get_loader(AGTYPE_OID, 0) is _AgtypeLoader
+
+    def test_agtype_loader_parses_vertex(self):
+        from age_orm.database import _AgtypeLoader
+
+        loader = _AgtypeLoader(AGTYPE_OID)
+        data = b'{"id": 7, "label": "Person", "properties": {"name": "Alice"}}::vertex'
+        result = loader.load(data)
+        assert result == {"graph_id": 7, "label": "Person", "properties": {"name": "Alice"}}
+        assert loader.load(memoryview(b"42")) == {"value": 42}
+
+    def test_agtype_loader_parses_edge_and_special_floats(self):
+        from age_orm.database import _AgtypeLoader
+
+        loader = _AgtypeLoader(AGTYPE_OID)
+        data = b'{"id": 9, "label": "KNOWS", "end_id": 2, "start_id": 1, "properties": {}}::edge'
+        assert loader.load(data) == {
+            "graph_id": 9, "label": "KNOWS", "end_id": 2, "start_id": 1, "properties": {}
+        }
+        result = loader.load(b'{"id": 7, "label": "P", "properties": {"x": NaN}}::vertex')
+        assert result["graph_id"] == 7
+        assert result["properties"]["x"] != result["properties"]["x"]
+
+    def test_autocommit_connection_left_in_autocommit(self):
+        from age_orm.database import _configure_age_connection
+
+        conn = FakeConnection(set())
+        conn.autocommit = True
+        _configure_age_connection(conn)
+        assert len(conn.executed) == 1
+        assert conn.autocommit is True
+
+
+class TestPoolDefaults:
+    def test_defaults_applied(self):
+        from age_orm.database import _DEFAULT_MAX_SIZE
+
+        db = Database("postgresql://fake", open=False)
+        assert db._pool.min_size == 1
+        assert db._pool.max_size == _DEFAULT_MAX_SIZE
+        assert db._pool.max_idle == 300
+
+    def test_fixed_size(self):
+        db = Database("postgresql://fake", fixed_size=4, open=False)
+        assert db._pool.min_size == 4
+        assert db._pool.max_size == 4
+
+    def test_explicit_kwargs_win(self):
+        db = Database("postgresql://fake", max_size=7, max_idle=60, open=False)
+        assert db._pool.max_size == 7
+        assert db._pool.max_idle == 60
+
+    def test_prepare_threshold(self):
+        from age_orm.database import _DEFAULT_PREPARE_THRESHOLD
+
+        db = Database("postgresql://fake", open=False)
+        assert db._pool.kwargs["prepare_threshold"] == _DEFAULT_PREPARE_THRESHOLD
+        conn_kwargs = {"prepare_threshold": None}
+        db = Database("postgresql://fake", kwargs=conn_kwargs, open=False)
+        assert db._pool.kwargs["prepare_threshold"] is None
+        assert conn_kwargs == {"prepare_threshold": None}
+
+    def test_unopened_pool(self):
+        db = Database("postgresql://fake", open=False)
+        assert db._pool.closed
+
+
+class TestSlots:
+    def test_database_has_no_instance_dict(self):
+        db = Database("postgresql://fake", open=False)
+        assert not hasattr(db, "__dict__")
+
+
+class TestLazyExports:
+    def test_package_exports_database(self):
+        import age_orm
+
+        assert age_orm.Database is Database
+        assert age_orm.AsyncDatabase is AsyncDatabase
+
+    def test_unknown_attribute_raises(self):
+        import age_orm
+
+        with pytest.raises(AttributeError):
+            _ = age_orm.NoSuchThing
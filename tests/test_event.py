@@ -2,7 +2,7 @@
 
 import pytest
 
-from age_orm.event import listen, listens_for, dispatch, _registrars
+from age_orm.event import listen, listens_for, dispatch, _registrars, _resolved_cache
 from age_orm.models.vertex import Vertex
 
 
@@ -16,8 +16,10 @@ class Person(Vertex):
 def clear_registrars():
     """Clear event registrars before each test."""
     _registrars.clear()
+    _resolved_cache.clear()
     yield
     _registrars.clear()
+    _resolved_cache.clear()
 
 
 class TestListen:
@@ -70,6 +72,35 @@ class TestListen:
         dispatch(p, "pre_add", graph="test_graph")
         assert received_kwargs["graph"] == "test_graph"
 
+    def test_dispatch_matches_base_class(self):
+        called = []
+
+        def handler(target, event, **kwargs):
+            called.append(type(target))
+
+        listen(Vertex, "pre_add", handler)
+        p = Person(name="Test", age=1)
+        dispatch(p, "pre_add")
+        assert called == [Person]
+
+    def test_listen_after_dispatch_invalidates_cache(self):
+        called = []
+
+        p = Person(name="Test", age=1)
+        dispatch(p, "pre_add")
+        listen(Person, "pre_add", lambda target, event, **kw: called.append(event))
+        dispatch(p, "pre_add")
+        assert called == ["pre_add"]
+
+    def test_handlers_fire_in_registration_order(self):
+        order = []
+
+        listen(Person, "pre_add", lambda target, event, **kw: order.append("person"))
+        listen(Vertex, "pre_add", lambda target, event, **kw: order.append("vertex"))
+        listen(Person, "pre_add", lambda target, event, **kw: order.append("person2"))
+        dispatch(Person(name="Test", age=1), "pre_add")
+        assert order == ["person", "vertex", "person2"]
+
 
 class TestListensFor:
     def test_decorator(self):
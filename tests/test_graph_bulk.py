@@ -0,0 +1,220 @@
+"""Tests for Graph bulk insert SQL generation (bulk_add(), flush(), ...)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from age_orm.event import _registrars, _resolved_cache, listen
+from age_orm.exceptions import EntityNotFoundError, LabelNotFoundError
+from age_orm.graph import _COPY_THRESHOLD, Graph
+from tests.conftest import Company, Knows, Person
+
+
+def make_graph(ids):
+    """Create a Graph whose pooled connection returns the given ids."""
+    db = MagicMock()
+    conn = db._pool.connection.return_value.__enter__.return_value
+    conn.execute.return_value.fetchall.return_value = [(i,) for i in ids]
+    g = Graph(name="test_graph", db=db)
+    g._known_labels.update({"Person", "KNOWS"})
+    return g, conn
+
+
+class TestBulkAdd:
+    def test_single_statement_with_returning(self):
+        g, conn = make_graph([11, 12])
+        people = [Person(name="Alice", age=30), Person(name="Bob", age=25)]
+
+        g.bulk_add(people)
+
+        assert conn.execute.call_count == 1
+        sql = conn.execute.call_args[0][0]
+        assert sql == (
+            'INSERT INTO test_graph."Person" (properties) '
+            "VALUES (%s::agtype), (%s::agtype) RETURNING id"
+        )
+        params = conn.execute.call_args[0][1]
+        assert params[0] == '{"name": "Alice", "age": 30, "email": null}'
+        assert [p.graph_id for p in people] == [11, 12]
+        assert not people[0].is_dirty
+
+    def test_large_batch_uses_copy(self):
+        n = _COPY_THRESHOLD + 1
+        g, conn = make_graph(range(100, 100 + n))
+        people = [Person(name=f"P{i}", age=i) for i in range(n)]
+
+        g.bulk_add(people)
+
+        allocate_sql, allocate_params = conn.execute.call_args[0]
+        assert "_graphid" in allocate_sql
+        assert allocate_params == (n, "test_graph", "Person")
+        conn.cursor.return_value.copy.assert_called_once_with(
+            'COPY test_graph."Person" (id, properties) FROM STDIN'
+        )
+        copy = conn.cursor.return_value.copy.return_value.__enter__.return_value
+        assert copy.write_row.call_count == n
+        graph_id, agtype_str = copy.write_row.call_args_list[0][0][0]
+        assert graph_id == 100
+        assert '"name": "P0"' in agtype_str
+        assert people[-1].graph_id == 100 + n - 1
+
+    def test_empty(self):
+        g, conn = make_graph([])
+        assert g.bulk_add([]) == []
+        conn.execute.assert_not_called()
+
+    def test_label_override_is_ensured(self):
+        g, conn = make_graph([11])
+        g.ensure_label = MagicMock()
+        g.bulk_add([Person(name="Alice", age=30)], label="VIP")
+        assert g.ensure_label.call_args.kwargs["label"] == "VIP"
+        assert conn.execute.call_args[0][0].startswith('INSERT INTO test_graph."VIP"')
+
+    def test_copy_raises_when_ids_not_allocated(self):
+        n = _COPY_THRESHOLD + 1
+        g, conn = make_graph([])
+        people = [Person(name=f"P{i}", age=i) for i in range(n)]
+
+        with pytest.raises(LabelNotFoundError):
+            g.bulk_add(people)
+
+        conn.cursor.return_value.copy.assert_not_called()
+        assert people[0].graph_id is None
+
+
+class TestFlush:
+    def test_one_insert_per_label(self):
+        g, conn = make_graph([11, 12])
+        g._known_labels.add("Company")
+        alice, acme, bob = Person(name="A", age=30), Company(name="Acme"), Person(name="B", age=2)
+        for entity in (alice, acme, bob):
+            assert g.add_deferred(entity) is entity
+        assert alice.graph_id is None
+
+        assert g.flush() == [alice, acme, bob]
+
+        sqls = [c[0][0] for c in conn.execute.call_args_list]
+        assert len(sqls) == 2
+        assert sqls[0].startswith('INSERT INTO test_graph."Person"')
+        assert sqls[1].startswith('INSERT INTO test_graph."Company"')
+        assert (alice.graph_id, bob.graph_id) == (11, 12)
+        assert g.flush() == []
+
+    def test_concurrent_groups_use_own_connections(self):
+        g, conn = make_graph([11])
+        g._known_labels.add("Company")
+        alice, acme = g.add_deferred(Person(name="A", age=30)), g.add_deferred(Company(name="X"))
+
+        g.flush(concurrency=4)
+
+        assert g._db._pool.connection.call_count == 2
+        assert conn.execute.call_count == 2
+        assert (alice.graph_id, acme.graph_id) == (11, 11)
+
+    def test_concurrency_ignored_in_session(self):
+        g, conn = make_graph([11])
+        g._known_labels.add("Company")
+        g.add_deferred(Person(name="A", age=30))
+        g.add_deferred(Company(name="X"))
+
+        with g.session():
+            g.flush(concurrency=4)
+
+        assert g._db._pool.connection.call_count == 1
+        assert conn.execute.call_count == 2
+
+    def test_failed_group_stays_queued(self):
+        g, conn = make_graph([11])
+        g._known_labels.add("Company")
+        alice, acme = g.add_deferred(Person(name="A", age=30)), g.add_deferred(Company(name="X"))
+        conn.execute.side_effect = [conn.execute.return_value, RuntimeError("boom")]
+
+        with pytest.raises(RuntimeError):
+            g.flush()
+
+        assert alice.graph_id == 11
+        assert g._pending_adds == [acme]
+        conn.execute.side_effect = None
+        assert g.flush() == [acme]
+        assert acme.graph_id == 11
+        assert g._pending_adds == []
+
+    def test_failed_flush_in_session_requeues_everything(self):
+        g, conn = make_graph([11])
+        g._known_labels.add("Company")
+        alice, acme = g.add_deferred(Person(name="A", age=30)), g.add_deferred(Company(name="X"))
+        conn.execute.side_effect = [conn.execute.return_value, RuntimeError("boom")]
+
+        with pytest.raises(RuntimeError), g.session():
+            g.flush()
+
+        assert g._pending_adds == [alice, acme]
+        assert alice.graph_id is None and alice._db is None
+        assert alice._dirty == {"name", "age", "email"}
+
+    def test_fires_add_events(self):
+        g, _ = make_graph([11])
+        seen = []
+        listen(Person, ["pre_add", "post_add"], lambda t, ev, **kw: seen.append((ev, t.graph_id)))
+        try:
+            g.add_deferred(Person(name="Alice", age=30))
+            g.flush()
+        finally:
+            _registrars.clear()
+            _resolved_cache.clear()
+        assert seen == [("pre_add", None), ("post_add", 11)]
+
+
+class TestBulkAddEdges:
+    def test_single_statement_with_returning(self):
+        g, conn = make_graph([21])
+        alice = Person(name="Alice", age=30)
+        bob = Person(name="Bob", age=25)
+        alice._graph_id, bob._graph_id = 1, 2
+
+        edges = g.bulk_add_edges([(alice, Knows(since=2020), bob)])
+
+        assert conn.execute.call_count == 1
+        sql, params = conn.execute.call_args[0]
+        assert sql.endswith(
+            "VALUES (%s::ag_catalog.graphid, %s::ag_catalog.graphid, %s::agtype) RETURNING id"
+        )
+        assert params[:2] == ["1", "2"]
+        assert edges[0].graph_id == 21
+        assert (edges[0].start_id, edges[0].end_id) == (1, 2)
+
+    def test_large_batch_uses_copy(self):
+        n = _COPY_THRESHOLD + 1
+        g, conn = make_graph(range(n))
+        alice = Person(name="Alice", age=30)
+        bob = Person(name="Bob", age=25)
+        alice._graph_id, bob._graph_id = 1, 2
+
+        edges = g.bulk_add_edges([(alice, Knows(since=i), bob) for i in range(n)])
+
+        copy = conn.cursor.return_value.copy.return_value.__enter__.return_value
+        assert copy.write_row.call_count == n
+        assert copy.write_row.call_args_list[1][0][0][:3] == (1, 1, 2)
+        assert edges[-1].graph_id == n - 1
+
+
+class TestConnectMany:
+    def test_one_insert_for_all_edges(self):
+        g, conn = make_graph([21, 22])
+        alice, bob, carol = (Person(name=n, age=1) for n in "ABC")
+        alice._graph_id, bob._graph_id, carol._graph_id = 1, 2, 3
+        first, second = Knows(since=2019), Knows(since=2021)
+
+        edges = g.connect_many([(alice, first, carol), (bob, second, carol)])
+
+        assert edges == [first, second]
+        assert conn.execute.call_count == 1
+        assert [(e.graph_id, e.start_id, e.end_id) for e in edges] == [(21, 1, 3), (22, 2, 3)]
+
+    def test_requires_persisted_vertices(self):
+        g, conn = make_graph([])
+        alice = Person(name="A", age=1)
+        alice._graph_id = 1
+        with pytest.raises(EntityNotFoundError):
+            g.connect_many([(alice, Knows(since=1), Person(name="B", age=2))])
+        conn.execute.assert_not_called()
@@ -4,7 +4,18 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from age_orm.graph import Graph, _remap_columns, _unwrap_scalar
+from age_orm.database import _ResultCache
+from age_orm.graph import (
+    AsyncGraph,
+    Graph,
+    _build_delete_cypher,
+    _build_update_cypher,
+    _cypher_sql,
+    _parse_agtype_result,
+    _parse_result_rows,
+    _remap_columns,
+    _unwrap_scalar,
+)
 
 
 # --- Unit tests for helper functions ---
@@ -34,6 +45,124 @@ class TestUnwrapScalar:
         assert _unwrap_scalar(None) is None
 
 
+class TestParseAgtypeResult:
+    def test_vertex(self):
+        raw = '{"id": 844424930131969, "label": "Person", "properties": {"name": "Alice"}}::vertex'
+        result = _parse_agtype_result(raw, "vertex")
+        assert result["graph_id"] == 844424930131969
+        assert result["label"] == "Person"
+        assert result["properties"] == {"name": "Alice"}
+        assert "id" not in result
+
+    def test_edge(self):
+        raw = (
+            '{"id": 1125899906842625, "label": "KNOWS", "end_id": 2, "start_id": 1, '
+            '"properties": {"since": 2020}}::edge'
+        )
+        result = _parse_agtype_result(raw, "edge")
+        assert result["graph_id"] == 1125899906842625
+        assert result["start_id"] == 1
+        assert result["end_id"] == 2
+
+    def test_edge_list(self):
+        raw = '[{"id": 5, "label": "KNOWS", "end_id": 2, "start_id": 1, "properties": {}}::edge]'
+        result = _parse_agtype_result(raw, "raw")
+        assert result["value"][0]["graph_id"] == 5
+
+    def test_scalars(self):
+        assert _parse_agtype_result("42", "raw") == {"value": 42}
+        assert _parse_agtype_result("3.5", "raw") == {"value": 3.5}
+        assert _parse_agtype_result('"text"', "raw") == {"value": "text"}
+        assert _parse_agtype_result("true", "raw") == {"value": True}
+        assert _parse_agtype_result("null", "raw") == {"value": None}
+
+    def test_scalar_suffix(self):
+        assert _parse_agtype_result("42::numeric", "raw") == {"value": 42}
+
+    def test_path_suffix(self):
+        raw = (
+            '[{"id": 1, "label": "A", "properties": {}}::vertex, '
+            '{"id": 3, "label": "R", "end_id": 2, "start_id": 1, "properties": {}}::edge, '
+            '{"id": 2, "label": "A", "properties": {}}::vertex]::path'
+        )
+        result = _parse_agtype_result(raw, "raw")
+        assert [item["graph_id"] for item in result["value"]] == [1, 3, 2]
+
+    def test_sql_null(self):
+        assert _parse_agtype_result(None, "raw") == {}
+
+    def test_unparseable(self):
+        assert _parse_agtype_result("NaNish", "raw") == {"raw": "NaNish"}
+
+    def test_numeric_forms(self):
+        assert _parse_agtype_result("-12", "raw") == {"value": -12}
+        assert _parse_agtype_result("1.5e3", "raw") == {"value": 1500.0}
+        assert _parse_agtype_result("-Infinity", "raw") == {"value": float("-inf")}
+        assert _parse_agtype_result("1-2", "raw") == {"raw": "1-2"}
+
+    def test_string_containing_double_colon(self):
+        assert _parse_agtype_result('"a::b"', "raw") == {"value": "a::b"}
+
+
+class TestParseResultRows:
+    def test_single_column(self):
+        assert _parse_result_rows([("1",), ("2",)], "raw") == [{"value": 1}, {"value": 2}]
+
+    def test_multi_column_keys(self):
+        rows = [('"a"', "1"), ('"b"', None)]
+        assert _parse_result_rows(rows, "raw", num_columns=2) == [
+            {"col_0": {"value": "a"}, "col_1": {"value": 1}},
+            {"col_0": {"value": "b"}, "col_1": {}},
+        ]
+
+    def test_wide_rows(self):
+        row = tuple(str(i) for i in range(70))
+        parsed = _parse_result_rows([row], "raw", num_columns=70)[0]
+        assert parsed["col_69"] == {"value": 69}
+
+
+class TestStatementBuilders:
+    def test_update_escapes_names_and_values(self):
+        assert _build_update_cypher(5, {"order": 1, "name": "O'Brien"}) == (
+            "MATCH (n) WHERE id(n) = 5 SET n.`order` = 1, n.`name` = 'O\\'Brien' RETURN n"
+        )
+
+    def test_delete_vertex_and_edge(self):
+        from tests.conftest import Knows, Person
+
+        person = Person(name="Alice", age=30)
+        person._graph_id = 1
+        knows = Knows(since=2020)
+        knows._graph_id = 2
+        assert _build_delete_cypher(person) == "MATCH (n) WHERE id(n) = 1 DETACH DELETE n"
+        assert _build_delete_cypher(knows) == "MATCH ()-[e]->() WHERE id(e) = 2 DELETE e"
+
+
+class TestCypherSql:
+    def test_without_params(self):
+        sql, args = _cypher_sql("g", "MATCH (n) RETURN n", None, None)
+        assert sql == "SELECT * FROM cypher('g', $$ MATCH (n) RETURN n $$) AS (result agtype)"
+        assert args is None
+
+    def test_params_bound_as_agtype_map(self):
+        sql, args = _cypher_sql(
+            "g", "MATCH (n) WHERE n.name = $name RETURN n", None, {"name": "O'Brien"}
+        )
+        assert sql == (
+            "SELECT * FROM cypher('g', $$ MATCH (n) WHERE n.name = $name RETURN n $$, %s) "
+            "AS (result agtype)"
+        )
+        assert args == ('{"name": "O\'Brien"}',)
+
+    def test_named_columns_quoted(self):
+        sql, _ = _cypher_sql("g", "MATCH (n) RETURN n.a, n.b", ["a", "order"], None)
+        assert sql.endswith('AS ("a" agtype, "order" agtype)')
+
+    def test_percent_escaped_with_params(self):
+        sql, _ = _cypher_sql("g", "RETURN $x % 2", None, {"x": 5})
+        assert "$x %% 2" in sql
+
+
 class TestRemapColumns:
     def test_multi_column_remap(self):
         hydrated = [
@@ -177,3 +306,340 @@ class TestGraphCypherRemapping:
 
         assert results[0]["word"] == "word1"
         assert results[0]["missing"] is None
+
+
+class TestEnsureLabelCache:
+    def _make_graph(self, existing=True):
+        mock_db = MagicMock()
+        conn = mock_db._pool.connection.return_value.__enter__.return_value
+        conn.execute.return_value.fetchone.return_value = (1,) if existing else None
+        return Graph(name="test_graph", db=mock_db), mock_db
+
+    def test_existing_label_checked_once(self):
+        class Person:
+            pass
+
+        g, db = self._make_graph()
+        g.ensure_label(Person)
+        g.ensure_label(Person)
+        assert db._pool.connection.call_count == 1
+
+    def test_lookup_is_prepared(self):
+        class Person:
+            pass
+
+        g, db = self._make_graph()
+        g.ensure_label(Person)
+        conn = db._pool.connection.return_value.__enter__.return_value
+        assert conn.execute.call_args.kwargs == {"prepare": True}
+
+    def test_created_label_is_remembered(self):
+        class Knows:
+            __label__ = "KNOWS"
+
+        g, db = self._make_graph(existing=False)
+        g.ensure_label(Knows, kind="e")
+        g.ensure_label(Knows, kind="e")
+        conn = db._pool.connection.return_value.__enter__.return_value
+        assert conn.execute.call_count == 2
+        assert "KNOWS" in g._known_labels
+
+    def test_label_created_on_shared_conn_not_cached(self):
+        class Person:
+            pass
+
+        g, db = self._make_graph(existing=False)
+        conn = MagicMock()
+        conn.execute.return_value.fetchone.return_value = None
+        g.ensure_label(Person, conn=conn)
+        assert "Person" not in g._known_labels
+        db._pool.connection.assert_not_called()
+
+    def test_add_checks_out_one_connection(self):
+        from tests.conftest import Person
+
+        g, db = self._make_graph()
+        conn = db._pool.connection.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = [
+            ('{"id": 7, "label": "Person", "properties": {}}::vertex',)
+        ]
+        person = g.add(Person(name="Alice", age=30))
+        assert db._pool.connection.call_count == 1
+        assert person.graph_id == 7
+
+
+class TestUpdate:
+    def _make_graph(self):
+        g = Graph(name="test_graph", db=MagicMock())
+        g._execute_cypher = MagicMock(return_value=[])
+        return g
+
+    def _loaded_person(self):
+        from tests.conftest import Person
+
+        p = Person(name="Alice", age=30, _db=object())
+        p._graph_id = 1
+        return p
+
+    def test_writes_only_dirty_fields(self):
+        g = self._make_graph()
+        p = self._loaded_person()
+        p.age = 31
+        g.update(p)
+        cypher = g._execute_cypher.call_args[0][0]
+        assert "SET n.`age` = 31 RETURN n" in cypher
+        assert not p.is_dirty
+
+    def test_clean_entity_written_in_full(self):
+        g = self._make_graph()
+        g.update(self._loaded_person())
+        cypher = g._execute_cypher.call_args[0][0]
+        assert "n.`name` = 'Alice'" in cypher and "n.`age` = 30" in cypher
+
+    def test_clean_entity_only_dirty_skipped(self):
+        g = self._make_graph()
+        g.update(self._loaded_person(), only_dirty=True)
+        g._execute_cypher.assert_not_called()
+
+    def test_dirty_field_serializer_applied(self):
+        from typing import Annotated
+
+        from pydantic import PlainSerializer
+
+        from age_orm import Vertex
+
+        class Shouty(Vertex):
+            name: Annotated[str, PlainSerializer(str.upper)]
+
+        g = self._make_graph()
+        s = Shouty(name="abc", _db=object())
+        s._graph_id = 1
+        s.name = "xyz"
+        assert s.dirty_fields_dump() == {"name": "XYZ"}
+        g.update(s)
+        assert "SET n.`name` = 'XYZ' RETURN n" in g._execute_cypher.call_args[0][0]
+
+
+class TestExpand:
+    def test_groups_by_last_edge_label(self):
+        from tests.conftest import Person
+
+        g = Graph(name="test_graph", db=MagicMock())
+        edge = {
+            "graph_id": 9, "label": "UNREGISTERED", "start_id": 1, "end_id": 2, "properties": {}
+        }
+        target = {"graph_id": 2, "label": "Nobody", "properties": {}}
+        g._execute_cypher = MagicMock(return_value=[
+            {"col_0": {"value": [edge]}, "col_1": target},
+            {"col_0": {"value": []}, "col_1": target},
+            {"col_0": {}, "col_1": target},
+        ])
+        v = Person(name="Alice", age=30)
+        v._graph_id = 1
+
+        g.expand(v)
+
+        assert v._relations == {"UNREGISTERED": [{"edge": edge, "target": target}]}
+
+
+class TestTraverse:
+    def _make_graph(self):
+        g = Graph(name="test_graph", db=MagicMock())
+        g._execute_cypher = MagicMock(return_value=[
+            {"graph_id": 2, "label": "Person", "properties": {"name": "Bob", "age": 25}}
+        ])
+        return g
+
+    def test_traverse_by_anchors_on_property(self):
+        from tests.conftest import Person
+
+        g = self._make_graph()
+        friends = g.traverse_by(
+            Person, "name", "Alice", "KNOWS", direction="inbound", target_class=Person
+        )
+
+        cypher = g._execute_cypher.call_args[0][0]
+        assert cypher == "MATCH (n:Person)<-[:KNOWS*1..1]-(m) WHERE n.name = $value RETURN m"
+        assert g._execute_cypher.call_args[1]["params"] == {"value": "Alice"}
+        assert isinstance(friends[0], Person) and friends[0].name == "Bob"
+
+    def test_traverse_anchors_on_graph_id(self):
+        from tests.conftest import Person
+
+        g = self._make_graph()
+        alice = Person(name="Alice", age=30)
+        alice._graph_id = 1
+        g.traverse(alice, "KNOWS", depth=2, target_class=Person)
+
+        cypher = g._execute_cypher.call_args[0][0]
+        assert cypher == "MATCH (n)-[:KNOWS*1..2]->(m) WHERE id(n) = 1 RETURN m"
+        assert g._execute_cypher.call_args[1]["params"] is None
+
+
+class FakePool:
+    """Counts checkouts; every statement returns one unregistered vertex."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.conn = MagicMock()
+        self.conn.execute.return_value.fetchall.return_value = [
+            ('{"id": 7, "label": "Nobody", "properties": {}}::vertex',)
+        ]
+        self.conn.execute.return_value.fetchone.return_value = (1,)
+
+    def connection(self):
+        pool = self
+
+        class _Ctx:
+            def __enter__(self):
+                pool.checkouts += 1
+                return pool.conn
+
+            def __exit__(self, *args):
+                return False
+
+        return _Ctx()
+
+
+class TestSession:
+    def _make_graph(self):
+        db = MagicMock()
+        db._pool = FakePool()
+        return Graph(name="test_graph", db=db), db._pool
+
+    def test_calls_share_one_checkout(self):
+        from tests.conftest import Knows, Person
+
+        g, pool = self._make_graph()
+        alice, bob = Person(name="Alice", age=30), Person(name="Bob", age=25)
+        with g.session() as conn:
+            assert conn is pool.conn
+            g.add(alice)
+            g.cypher("MATCH (n) RETURN n")
+            with g.session():
+                g.add(bob)
+                g.connect(alice, Knows(since=2020), bob)
+        assert pool.checkouts == 1
+
+    def test_without_session_checks_out_per_call(self):
+        g, pool = self._make_graph()
+        g.cypher("MATCH (n) RETURN n")
+        g.cypher("MATCH (n) RETURN n")
+        assert pool.checkouts == 2
+
+    def test_copied_context_outliving_session_checks_out_own_connection(self):
+        import contextvars
+
+        g, pool = self._make_graph()
+        with g.session():
+            ctx = contextvars.copy_context()
+        ctx.run(g.cypher, "MATCH (n) RETURN n")
+        assert pool.checkouts == 2
+
+    def test_session_bypasses_result_cache(self):
+        g, pool = self._make_graph()
+        g._db._results = _ResultCache(16)
+        with pytest.raises(RuntimeError), g.session():
+            g.cypher("MATCH (n) RETURN n", cached=True)
+            g.cypher("MATCH (n) RETURN n", cached=True)
+            version = g._db._results._versions.get("test_graph", 0)
+            raise RuntimeError("rollback")
+        assert pool.conn.execute.call_count == 2
+        assert not g._db._results._entries
+        assert g._db._results._versions["test_graph"] == version + 1
+
+
+class FakeAsyncCursor:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def fetchall(self):
+        return self._rows
+
+    async def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeAsyncPool:
+    """Counts checkouts; every statement returns one unregistered vertex."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.conn = MagicMock()
+
+        async def execute(sql, params=None, prepare=None):
+            return FakeAsyncCursor([('{"id": 7, "label": "Nobody", "properties": {}}::vertex',)])
+
+        self.conn.execute = execute
+
+    def connection(self):
+        pool = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                pool.checkouts += 1
+                return pool.conn
+
+            async def __aexit__(self, *args):
+                return False
+
+        return _Ctx()
+
+
+class TestAsyncSession:
+    def _make_graph(self):
+        db = MagicMock()
+        db._pool = FakeAsyncPool()
+        return AsyncGraph(name="test_graph", db=db), db._pool
+
+    async def test_calls_share_one_checkout(self):
+        from tests.conftest import Person
+
+        g, pool = self._make_graph()
+        async with g.session() as conn:
+            assert conn is pool.conn
+            await g.add(Person(name="Alice", age=30))
+            await g.cypher("MATCH (n) RETURN n")
+            async with g.session():
+                await g.add(Person(name="Bob", age=25))
+        assert pool.checkouts == 1
+
+    async def test_without_session_checks_out_per_call(self):
+        g, pool = self._make_graph()
+        await g.cypher("MATCH (n) RETURN n")
+        await g.cypher("MATCH (n) RETURN n")
+        assert pool.checkouts == 2
+
+    async def test_session_bypasses_result_cache(self):
+        g, _ = self._make_graph()
+        g._db._results = _ResultCache(16)
+        with pytest.raises(RuntimeError):
+            async with g.session():
+                await g.cypher("MATCH (n) RETURN n", cached=True)
+                raise RuntimeError("rollback")
+        assert not g._db._results._entries
+        assert g._db._results._versions["test_graph"] == 1
+
+    async def test_task_outliving_session_checks_out_own_connection(self):
+        import asyncio
+
+        g, pool = self._make_graph()
+        release = asyncio.Event()
+
+        async def later():
+            await release.wait()
+            await g.cypher("MATCH (n) RETURN n")
+
+        async with g.session():
+            task = asyncio.create_task(later())
+        assert pool.checkouts == 1
+        release.set()
+        await task
+        assert pool.checkouts == 2
+
+    async def test_other_pool_not_reused(self):
+        g, _ = self._make_graph()
+        other, other_pool = self._make_graph()
+        async with g.session():
+            await other.cypher("MATCH (n) RETURN n")
+        assert other_pool.checkouts == 1
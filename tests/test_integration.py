@@ -9,8 +9,10 @@ Run with:
     uv run pytest tests/test_integration.py -v -s
 """
 
+from collections import deque
+
 import pytest
-from age_orm import Database, Vertex, Edge, Graph, listen, listens_for
+from age_orm import Database, Vertex, Edge, Graph, listens_for
 
 # ── Models ──────────────────────────────────────────────────────────
 
@@ -49,23 +51,68 @@ class WorksAt(Edge):
 @pytest.fixture(scope="module")
 def db():
     """Create a Database connection for the test session."""
-    database = Database(DSN)
+    # The local server isn't going away mid-run: skip the pool's per-checkout
+    # health-check round-trip. AGE setup already runs once per connection.
+    database = Database(DSN, check=None)
     yield database
     # Cleanup: drop graph if it still exists
-    if database.graph_exists(GRAPH_NAME):
-        database.drop_graph(GRAPH_NAME)
+    database.drop_graph_if_exists(GRAPH_NAME)
     database.close()
 
 
 @pytest.fixture(scope="module")
 def graph(db):
     """Create a fresh graph for the test session."""
-    if db.graph_exists(GRAPH_NAME):
-        db.drop_graph(GRAPH_NAME)
+    db.drop_graph_if_exists(GRAPH_NAME)
     g = db.graph(GRAPH_NAME, create=True)
     return g
 
 
+# People created by TestVertexCRUD, looked up once for the edge and traversal
+# tests that only need them as endpoints. Requested after they exist.
+
+
+@pytest.fixture(scope="module")
+def alice(graph):
+    return graph.query(Person).filter_by(name="Alice").one()
+
+
+@pytest.fixture(scope="module")
+def bob(graph):
+    return graph.query(Person).filter_by(name="Bob").one()
+
+
+@pytest.fixture(scope="module")
+def charlie(graph):
+    return graph.query(Person).filter_by(name="Charlie").one()
+
+
+@pytest.fixture(scope="module")
+def diana(graph):
+    return graph.query(Person).filter_by(name="Diana").one()
+
+
+@pytest.fixture(scope="module")
+def _person_event_log():
+    """One Person listener for every CRUD event, registered for the module."""
+    log = deque()
+
+    @listens_for(Person, [
+        "pre_add", "post_add", "pre_update", "post_update", "pre_delete", "post_delete"
+    ])
+    def record(target, event, **kwargs):
+        log.append(event)
+
+    return log
+
+
+@pytest.fixture
+def events_fired(_person_event_log):
+    """Person events fired during the current test."""
+    _person_event_log.clear()
+    return _person_event_log
+
+
 # ── Tests ───────────────────────────────────────────────────────────
 
 
@@ -158,7 +205,11 @@ class TestVertexCRUD:
         diana = Person(name="Diana", age=28)
 
         for person in [bob, charlie, diana]:
-            graph.add(person)
+            graph.add_deferred(person)
+        assert bob.graph_id is None
+
+        graph.flush()
+        for person in [bob, charlie, diana]:
             assert person.graph_id is not None
 
     def test_query_count(self, graph):
@@ -215,11 +266,8 @@ class TestVertexCRUD:
 class TestEdgeCRUD:
     """Test creating and querying edges."""
 
-    def test_connect(self, graph):
+    def test_connect(self, graph, alice, bob):
         """graph.connect() creates an edge between two vertices."""
-        alice = graph.query(Person).filter_by(name="Alice").one()
-        bob = graph.query(Person).filter_by(name="Bob").one()
-
         knows = Knows(since=2020, relationship_type="colleague")
         graph.connect(alice, knows, bob)
 
@@ -228,51 +276,52 @@ class TestEdgeCRUD:
         assert knows.end_id == bob.graph_id
         assert not knows.is_dirty
 
-    def test_connect_multiple(self, graph):
+    def test_connect_multiple(self, graph, alice, bob, charlie, diana):
         """Create several more edges for traversal tests."""
-        alice = graph.query(Person).filter_by(name="Alice").one()
-        charlie = graph.query(Person).filter_by(name="Charlie").one()
-        diana = graph.query(Person).filter_by(name="Diana").one()
-
-        # Alice knows Charlie
-        graph.connect(alice, Knows(since=2019, relationship_type="friend"), charlie)
-        # Bob knows Diana
-        bob = graph.query(Person).filter_by(name="Bob").one()
-        graph.connect(bob, Knows(since=2021, relationship_type="friend"), diana)
-
-    def test_add_company_and_works_at(self, graph):
+        edges = graph.connect_many([
+            # Alice knows Charlie
+            (alice, Knows(since=2019, relationship_type="friend"), charlie),
+            # Bob knows Diana
+            (bob, Knows(since=2021, relationship_type="friend"), diana),
+        ])
+        assert edges[1].start_id == bob.graph_id
+        assert all(e.graph_id is not None for e in edges)
+
+    def test_add_company_and_works_at(self, graph, alice):
         """Create Company vertices and WorksAt edges."""
         acme = Company(name="Acme Corp", industry="Technology")
-        graph.add(acme)
-        assert acme.graph_id is not None
-
-        alice = graph.query(Person).filter_by(name="Alice").one()
         works = WorksAt(role="Engineer", start_year=2018)
-        graph.connect(alice, works, acme)
+        # One connection and one commit for both statements
+        with graph.session():
+            graph.add(acme)
+            assert acme.graph_id is not None
+            graph.connect(alice, works, acme)
         assert works.graph_id is not None
 
 
 class TestTraversal:
     """Test graph traversal operations."""
 
-    def test_traverse_outbound(self, graph):
+    def test_traverse_outbound(self, graph, alice):
         """traverse() finds outbound neighbors."""
-        alice = graph.query(Person).filter_by(name="Alice").one()
         friends = graph.traverse(alice, "KNOWS", direction="outbound", target_class=Person)
         names = {p.name for p in friends}
         assert "Bob" in names
         assert "Charlie" in names
 
-    def test_traverse_inbound(self, graph):
+    def test_traverse_inbound(self, graph, bob):
         """traverse() finds inbound neighbors."""
-        bob = graph.query(Person).filter_by(name="Bob").one()
         who_knows_bob = graph.traverse(bob, "KNOWS", direction="inbound", target_class=Person)
         names = {p.name for p in who_knows_bob}
         assert "Alice" in names
 
-    def test_traverse_auto_hydrates_without_target_class(self, graph):
+    def test_traverse_by_property(self, graph):
+        """traverse_by() starts from vertices matched by a property."""
+        who_knows_bob = graph.traverse_by(Person, "name", "Bob", "KNOWS", direction="inbound")
+        assert {p.name for p in who_knows_bob} == {"Alice"}
+
+    def test_traverse_auto_hydrates_without_target_class(self, graph, alice):
         """traverse() without target_class auto-hydrates via label registry."""
-        alice = graph.query(Person).filter_by(name="Alice").one()
         results = graph.traverse(alice, "KNOWS", direction="outbound")
         assert len(results) >= 2
         for r in results:
@@ -280,9 +329,8 @@ class TestTraversal:
             assert r.graph_id is not None
             assert not r.is_dirty
 
-    def test_expand_hydrates_relations(self, graph):
+    def test_expand_hydrates_relations(self, graph, alice):
         """expand() auto-hydrates edge and target in vertex._relations."""
-        alice = graph.query(Person).filter_by(name="Alice").one()
         graph.expand(alice, direction="outbound")
         assert "KNOWS" in alice._relations
         for entry in alice._relations["KNOWS"]:
@@ -410,14 +458,8 @@ class TestQueryBulkMutations:
 class TestEvents:
     """Test the event system with real operations."""
 
-    def test_pre_post_add_events(self, graph):
+    def test_pre_post_add_events(self, graph, events_fired):
         """pre_add and post_add events fire during graph.add()."""
-        events_fired = []
-
-        @listens_for(Person, ["pre_add", "post_add"])
-        def on_add(target, event, **kwargs):
-            events_fired.append(event)
-
         person = Person(name="EventTest", age=99)
         graph.add(person)
 
@@ -427,14 +469,8 @@ class TestEvents:
         # Cleanup
         graph.delete(person)
 
-    def test_pre_post_update_events(self, graph):
+    def test_pre_post_update_events(self, graph, events_fired):
         """pre_update and post_update events fire during graph.update()."""
-        events_fired = []
-
-        @listens_for(Person, ["pre_update", "post_update"])
-        def on_update(target, event, **kwargs):
-            events_fired.append(event)
-
         alice = graph.query(Person).filter_by(name="Alice").one()
         alice.age = 32
         graph.update(alice)
@@ -442,14 +478,8 @@ class TestEvents:
         assert "pre_update" in events_fired
         assert "post_update" in events_fired
 
-    def test_pre_post_delete_events(self, graph):
+    def test_pre_post_delete_events(self, graph, events_fired):
         """pre_delete and post_delete events fire during graph.delete()."""
-        events_fired = []
-
-        @listens_for(Person, ["pre_delete", "post_delete"])
-        def on_delete(target, event, **kwargs):
-            events_fired.append(event)
-
         person = Person(name="ToDelete", age=1)
         graph.add(person)
         graph.delete(person)
@@ -475,8 +505,8 @@ class TestDeleteVertex:
 class TestCleanup:
     """Cleanup tests - drop graph at the end."""
 
-    def test_drop_graph(self, db):
-        """db.drop_graph() removes the graph."""
-        if db.graph_exists(GRAPH_NAME):
-            db.drop_graph(GRAPH_NAME)
+    def test_drop_graph(self, db, graph):
+        """db.drop_graph() removes the graph; dropping it again is a no-op."""
+        db.drop_graph(GRAPH_NAME)
+        assert not db.drop_graph_if_exists(GRAPH_NAME)
         assert not db.graph_exists(GRAPH_NAME)
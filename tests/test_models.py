@@ -71,11 +71,36 @@ class TestVertex:
         dirty = p.dirty_fields_dump()
         assert dirty == {"name": "Changed"}
 
+    def test_dirty_fields_dump_clean(self):
+        from tests.conftest import Person
+
+        p = Person(name="Test", age=1, _db=object())
+        assert p.dirty_fields_dump() == {}
+
+    def test_dirty_fields_dump_non_plain(self):
+        import datetime
+
+        class Dated(Vertex):
+            name: str
+            when: datetime.date
+
+        d = Dated(name="A", when=datetime.date(2024, 1, 2), _db=object())
+        d.when = datetime.date(2024, 3, 4)
+        assert not Dated._age_plain_dump
+        assert d.dirty_fields_dump() == {"when": "2024-03-04"}
+        assert d.dirty_fields_dump(mode="python") == {"when": datetime.date(2024, 3, 4)}
+
     def test_str_repr(self, alice):
         s = str(alice)
         assert "Person" in s
         assert "Alice" in s
 
+    def test_repr_skips_relationships(self):
+        from tests.conftest import PersonWithRels
+
+        p = PersonWithRels(name="A", age=1)
+        assert repr(p) == str(p) == "PersonWithRels(name='A', age=1)"
+
 
 class TestEdge:
     def test_create_basic(self, knows_edge):
@@ -90,6 +115,11 @@ class TestEdge:
         assert knows_edge.is_dirty
         assert "since" in knows_edge._dirty
 
+    def test_edge_endpoint_setters(self, knows_edge):
+        knows_edge._start_id = 1
+        knows_edge._age_end_id = 2
+        assert (knows_edge.start_id, knows_edge.end_id) == (1, 2)
+
     def test_edge_model_dump(self, knows_edge):
         data = knows_edge.model_dump()
         assert "since" in data
@@ -116,9 +146,104 @@ class TestRelationshipField:
         assert "friends" not in data
         assert "employer" not in data
 
+    def test_relationship_excluded_with_caller_exclude(self):
+        from tests.conftest import PersonWithRels
+
+        p = PersonWithRels(name="Test", age=25)
+        assert p.model_dump(exclude={"age"}) == {"name": "Test"}
+
+    def test_relationship_on_model_construct_instance(self):
+        from tests.conftest import PersonWithRels
+
+        p = PersonWithRels.model_construct(name="Test", age=25)
+        assert not hasattr(p, "friends")
+        with pytest.raises(AttributeError, match="employer"):
+            _ = p.employer
+        assert p.name == "Test"
+
     def test_relationship_access_without_db_raises(self):
         from tests.conftest import PersonWithRels
 
         p = PersonWithRels(name="Test", age=25)
         with pytest.raises(DetachedInstanceError):
             _ = p.friends
+
+    def test_field_partition_shared_per_class(self):
+        from tests.conftest import PersonWithRels
+
+        a = PersonWithRels(name="A", age=1)
+        b = PersonWithRels(name="B", age=2)
+        assert set(PersonWithRels._age_refs_cls) == {"friends", "employer"}
+        assert a._refs is b._refs is PersonWithRels._age_refs_cls
+        assert a._dirty == {"name", "age"}
+        a._dirty.clear()
+        assert b._dirty == {"name", "age"}
+
+    def test_dirty_bitmask(self):
+        from tests.conftest import PersonWithRels
+
+        p = PersonWithRels(name="A", age=1, _db=object())
+        assert p._age_dirty == 0
+        p.age = 2
+        assert p._age_dirty == PersonWithRels._age_field_bits["age"]
+        p._dirty = {"name"}
+        assert p._dirty == {"name"}
+        assert p.dirty_fields_dump() == {"name": "A"}
+        p._dirty.discard("name")
+        assert not p.is_dirty
+
+    def test_generated_init(self):
+        from tests.conftest import Person, PersonWithRels
+
+        assert Person.__init__.__code__.co_filename == "<age_init:Person>"
+
+        class Custom(PersonWithRels):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+
+        c = Custom(name="C", age=3, _graph_id=9)
+        assert "__init__" in Custom.__dict__
+        assert c.graph_id == 9
+        assert c.label == "PersonRel"
+        assert c._dirty == {"name", "age"}
+
+    def test_setter_cached_per_class(self):
+        from tests.conftest import Person, PersonWithRels
+
+        p = PersonWithRels(name="A", age=1, _db=object())
+        p.name = "B"
+        p._graph_id = 5
+        assert p._dirty == {"name"}
+        assert p.graph_id == 5
+        assert "name" in PersonWithRels._age_setters
+        assert Person._age_setters is not PersonWithRels._age_setters
+
+    def test_relationship_lazy_load_cached(self):
+        from unittest.mock import MagicMock
+
+        from tests.conftest import PersonWithRels
+
+        graph = MagicMock()
+        graph._execute_cypher.return_value = []
+        p = PersonWithRels(name="Test", age=25, _db=object(), _graph=graph)
+        p._graph_id = 7
+        assert p.friends == []
+        assert p.employer is None
+        assert p.friends == []
+        assert graph._execute_cypher.call_count == 2
+        cypher = graph._execute_cypher.call_args_list[0][0][0]
+        assert cypher == "MATCH (n)-[:KNOWS]->(m:PersonRel) WHERE id(n) = 7 RETURN m"
+
+    def test_relationship_inherited_by_subclass(self):
+        from age_orm.references import Relationship
+        from tests.conftest import PersonWithRels
+
+        class Employee(PersonWithRels):
+            badge: int = 0
+
+        assert isinstance(Employee.model_fields["friends"].default, Relationship)
+        e = Employee(name="E", age=40)
+        assert e._dirty == {"name", "age", "badge"}
+        assert "friends" not in e.model_dump()
+        with pytest.raises(DetachedInstanceError):
+            _ = e.friends
@@ -47,19 +47,21 @@ class TestQueryBuilding:
         query.filter("n.age > $min_age", min_age=20)
         cypher = query._build_cypher()
         assert "WHERE" in cypher
-        assert "n.age > 20" in cypher
+        assert "n.age > $min_age" in cypher
+        assert query._bind_vars == {"min_age": 20}
 
     def test_filter_by(self, query):
         query.filter_by(name="Alice")
         cypher = query._build_cypher()
         assert "WHERE" in cypher
-        assert "n.name = 'Alice'" in cypher
+        assert "n.name = $name" in cypher
+        assert query._bind_vars == {"name": "Alice"}
 
     def test_filter_by_multiple(self, query):
         query.filter_by(name="Alice", age=30)
         cypher = query._build_cypher()
-        assert "n.name = 'Alice'" in cypher
-        assert "n.age = 30" in cypher
+        assert "(n.name = $name AND n.age = $age)" in cypher
+        assert query._bind_vars == {"name": "Alice", "age": 30}
 
     def test_filter_and(self, query):
         query.filter("n.age > $min", min=20).filter("n.age < $max", max=50)
@@ -105,11 +107,29 @@ class TestQueryBuilding:
         cypher = query._build_cypher()
         assert "MATCH (n:Person)" in cypher
         assert "WHERE" in cypher
-        assert "n.age > 20" in cypher
+        assert "n.age > $min" in cypher
         assert "ORDER BY n.name" in cypher
         assert "SKIP 2" in cypher
         assert "LIMIT 5" in cypher
 
+    def test_async_query_builds_same_cypher(self, query, graph):
+        from age_orm.query.builder import AsyncQuery
+
+        aquery = AsyncQuery(model_class=Person, graph=graph)
+        for q in (query, aquery):
+            q.filter("n.age > $min", min=20).filter_by(_or=True, name="Bob").sort("n.name")
+        assert aquery._build_cypher() == query._build_cypher()
+
+    def test_same_shape_reuses_rendered_cypher(self, graph):
+        a = Query(model_class=Person, graph=graph).filter_by(name="Alice").limit(5)
+        b = Query(model_class=Person, graph=graph).filter_by(name="Bob").limit(5)
+        assert a._build_cypher() is b._build_cypher()
+        assert a._bind_vars == {"name": "Alice"}
+        assert a._build_cypher(limit=1).endswith("LIMIT 1")
+
+    def test_slots(self, query):
+        assert not hasattr(query, "__dict__")
+
     def test_str_representation(self, query):
         query.filter_by(name="Alice")
         s = str(query)
@@ -168,6 +188,40 @@ class TestQueryIteration:
         assert iter_names == all_names
 
 
+    def test_all_dicts_returns_rows(self, graph):
+        rows = [{"graph_id": 1, "label": "Person", "properties": {"name": "Alice", "age": 30}}]
+        graph._execute_cypher = lambda *a, **kw: rows
+        assert Query(model_class=Person, graph=graph).all_dicts() is rows
+
+    def test_first_and_one_limit_rows(self, graph):
+        """first() and one() ask for at most 1 and 2 rows without touching _limit."""
+        from age_orm.exceptions import EntityNotFoundError, MultipleResultsError
+
+        rows = [
+            {"graph_id": 1, "label": "Person", "properties": {"name": "Alice", "age": 30}},
+            {"graph_id": 2, "label": "Person", "properties": {"name": "Bob", "age": 25}},
+        ]
+        calls = []
+
+        def execute(cypher, **kw):
+            calls.append(cypher)
+            return rows[: int(cypher.rsplit("LIMIT ", 1)[1])]
+
+        graph._execute_cypher = execute
+        query = Query(model_class=Person, graph=graph)
+        assert query.first().name == "Alice"
+        with pytest.raises(MultipleResultsError):
+            query.one()
+        assert query.limit(1).one().name == "Alice"
+        assert [c.rsplit("\n", 1)[1] for c in calls] == ["LIMIT 1", "LIMIT 2", "LIMIT 1"]
+        assert query._limit == 1
+
+        graph._execute_cypher = lambda *a, **kw: []
+        assert query.first() is None
+        with pytest.raises(EntityNotFoundError):
+            query.one()
+
+
 class TestQueryByIdCypher:
     def test_by_id_builds_correct_cypher(self, graph):
         query = Query(model_class=Person, graph=graph)
@@ -176,6 +230,39 @@ class TestQueryByIdCypher:
         assert "Person" in cypher
 
 
+class TestQueryDelete:
+    def test_delete_counts_in_one_statement(self, graph):
+        from unittest.mock import MagicMock
+
+        graph._db = MagicMock()
+        graph.name = graph._name
+        calls = []
+
+        def execute(cypher, params=None, **kw):
+            calls.append((cypher, params))
+            return [{"value": 3}]
+
+        graph._execute_cypher = execute
+        assert Query(model_class=Person, graph=graph).filter_by(age=1).delete() == 3
+        assert calls == [
+            ("MATCH (n:Person)\nWHERE n.age = $age\nDETACH DELETE n\nRETURN count(n)", {"age": 1})
+        ]
+
+    def test_update_binds_values(self, graph):
+        from unittest.mock import MagicMock
+
+        graph._db = MagicMock()
+        graph.name = graph._name
+        graph._execute_cypher = MagicMock(return_value=[{"value": 2}])
+        query = Query(model_class=Person, graph=graph).filter("n.age > $age", age=1)
+        assert query.update(age=5) == 2
+        graph._execute_cypher.assert_called_once_with(
+            "MATCH (n:Person)\nWHERE n.age > $age\nSET n.age = $_set_age\nRETURN count(n)",
+            params={"age": 1, "_set_age": 5},
+            return_type="raw",
+        )
+
+
 class TestLabelRegistry:
     """Test the AgeModel._label_registry populated via __init_subclass__."""
 
@@ -65,3 +65,48 @@ class TestRelationshipFactory:
         r = Relationship(target_class="nonexistent.module.Class", edge_label="TEST")
         with pytest.raises(ImportError, match="Cannot resolve"):
             r.resolve_target_class()
+
+    def test_build_cypher(self):
+        from age_orm.models.vertex import Vertex
+
+        class Target(Vertex):
+            __label__ = "Target"
+
+        r = Relationship(target_class=Target, edge_label="LINKS", direction="inbound", depth=2)
+        assert r.build_cypher(5) == (
+            "MATCH (n)<-[:LINKS*1..2]-(m:Target) WHERE id(n) = 5 RETURN m"
+        )
+        assert r.build_cypher(6).endswith("id(n) = 6 RETURN m")
+
+    def test_resolve_target_class_by_label_or_name(self):
+        from age_orm.models.vertex import Vertex
+
+        class NamedTarget(Vertex):
+            __label__ = "NamedTargetLabel"
+
+        assert Relationship("NamedTargetLabel", "T").resolve_target_class() is NamedTarget
+        assert Relationship("NamedTarget", "T").resolve_target_class() is NamedTarget
+        with pytest.raises(ImportError, match="Cannot resolve"):
+            Relationship("NoSuchModel", "T").resolve_target_class()
+
+    def test_slots(self):
+        r = Relationship(target_class="some.module.Person", edge_label="KNOWS")
+        assert not hasattr(r, "__dict__")
+
+    def test_build_cypher_single_valued_limits_one(self):
+        from age_orm.models.vertex import Vertex
+
+        class Owner(Vertex):
+            __label__ = "Owner"
+
+        r = Relationship(target_class=Owner, edge_label="OWNED_BY", uselist=False)
+        assert r.build_cypher(1) == (
+            "MATCH (n)-[:OWNED_BY]->(m:Owner) WHERE id(n) = 1 RETURN m LIMIT 1"
+        )
+
+    def test_direction_arrows_precomputed(self):
+        assert (Relationship("x.Y", "E").dir_left, Relationship("x.Y", "E").dir_right) == ("", ">")
+        inbound = Relationship("x.Y", "E", direction="inbound")
+        assert (inbound.dir_left, inbound.dir_right) == ("<", "")
+        both = Relationship("x.Y", "E", direction="any")
+        assert (both.dir_left, both.dir_right) == ("", "")
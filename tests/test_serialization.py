@@ -1,5 +1,9 @@
 """Tests for agtype serialization utilities."""
 
+import json
+
+import pytest
+
 from age_orm.utils.serialization import (
     escape_agtype_string,
     escape_sql_literal,
@@ -8,6 +12,11 @@ from age_orm.utils.serialization import (
     format_cypher_value,
     substitute_cypher_params,
     model_to_cypher_properties,
+    json_loads,
+    dict_to_model,
+    parse_agtype_edge,
+    parse_agtype_element,
+    parse_agtype_vertex,
 )
 
 
@@ -34,9 +43,16 @@ class TestEscapeAgtypeString:
         result = escape_agtype_string("\x01\x02")
         assert result == "\\u0001\\u0002"
 
+    def test_short_and_unicode_escapes(self):
+        assert escape_agtype_string("\b\f\x1f") == "\\b\\f\\u001f"
+        assert json.loads('"' + escape_agtype_string("a\b\x00\\") + '"') == "a\b\x00\\"
+
     def test_none_input(self):
         assert escape_agtype_string(None) == ""
 
+    def test_non_ascii_unchanged(self):
+        assert escape_agtype_string("caf\u00e9 \u2603\x7f") == "caf\u00e9 \u2603\x7f"
+
     def test_mixed_special_chars(self):
         result = escape_agtype_string('He said "hello\\world"\n')
         assert result == 'He said \\"hello\\\\world\\"\\n'
@@ -111,6 +127,31 @@ class TestToAgtypeProperties:
     def test_empty(self):
         assert to_agtype_properties({}) == "{}"
 
+    def test_unencodable_values_fall_back(self):
+        import datetime
+
+        result = to_agtype_properties(
+            {"on": datetime.date(2024, 1, 2), "x": [float("nan")], 'k"ey': "\u00e9"}
+        )
+        assert result == '{"on": "2024-01-02", "x": [nan], "k\\"ey": "\u00e9"}'
+
+
+class TestValueSubclasses:
+    def test_subclasses_use_isinstance_fallback(self):
+        import enum
+
+        class Color(enum.StrEnum):
+            RED = "red"
+
+        class Level(enum.IntEnum):
+            HIGH = 3
+
+        assert to_agtype_value(Color.RED) == '"red"'
+        assert to_agtype_value(Level.HIGH) == "3"
+        assert format_cypher_value(Color.RED) == "'red'"
+        assert format_cypher_value(Level.HIGH) == "3"
+        assert to_agtype_value((1, 2)) == '"(1, 2)"'
+
 
 class TestFormatCypherValue:
     def test_none(self):
@@ -132,6 +173,10 @@ class TestFormatCypherValue:
     def test_string_with_single_quote(self):
         assert format_cypher_value("it's") == "'it\\'s'"
 
+    def test_string_with_backslash(self):
+        assert format_cypher_value("a\\b") == "'a\\\\b'"
+        assert format_cypher_value("\\'") == "'\\\\\\''"
+
     def test_list(self):
         result = format_cypher_value([1, "a"])
         assert result == "[1, 'a']"
@@ -176,6 +221,20 @@ class TestSubstituteCypherParams:
         )
         assert "'Bob'" in result
 
+    def test_values_are_not_rescanned(self):
+        result = substitute_cypher_params(
+            "WHERE n.a = $a AND n.b = $b", {"a": "$b", "b": "x\\y"}
+        )
+        assert result == "WHERE n.a = '$b' AND n.b = 'x\\\\y'"
+
+    def test_no_placeholders_returns_input(self):
+        cypher = "MATCH (n) RETURN n"
+        assert substitute_cypher_params(cypher, {"a": 1}) is cypher
+        assert substitute_cypher_params(cypher, {}) is cypher
+
+    def test_unknown_placeholder_left_alone(self):
+        assert substitute_cypher_params("RETURN $missing", {"a": 1}) == "RETURN $missing"
+
 
 class TestModelToCypherProperties:
     def test_basic(self):
@@ -196,3 +255,228 @@ class TestModelToCypherProperties:
         assert "name: 'Alice'" in result
         assert "age" not in result
         assert "email" not in result
+
+    def test_plain_model_template(self):
+        from tests.conftest import Person
+
+        assert Person._age_plain_dump
+        p = Person(name="A", age=3, email="x")
+        assert model_to_cypher_properties(p) == "{name: 'A', age: 3, email: 'x'}"
+        assert model_to_cypher_properties(p, only={"age"}) == "{age: 3}"
+
+    def test_non_plain_model_uses_serializer(self):
+        import datetime
+
+        from age_orm import Vertex
+
+        class Dated(Vertex):
+            when: datetime.date
+
+        assert not Dated._age_plain_dump
+        result = model_to_cypher_properties(Dated(when=datetime.date(2024, 1, 2)))
+        assert result == "{when: '2024-01-02'}"
+
+    def test_annotated_serializer_is_not_plain(self):
+        from typing import Annotated
+
+        from pydantic import PlainSerializer
+
+        from age_orm import Vertex
+
+        class Shouty(Vertex):
+            name: Annotated[str, PlainSerializer(str.upper)]
+
+        assert not Shouty._age_plain_dump
+        assert model_to_cypher_properties(Shouty(name="abc")) == "{name: 'ABC'}"
+
+
+class TestModelToAgtype:
+    def test_excludes_relationships(self):
+        from age_orm.utils.serialization import model_to_agtype
+        from tests.conftest import PersonWithRels
+
+        p = PersonWithRels(name="A", age=1)
+        assert model_to_agtype(p) == '{"name": "A", "age": 1}'
+
+    def test_many_models(self):
+        from age_orm.utils.serialization import models_to_agtype, models_to_cypher_properties
+        from tests.conftest import Company, PersonWithRels
+
+        models = [
+            PersonWithRels(name="A", age=1),
+            Company(name="C"),
+            PersonWithRels(name="B", age=2),
+        ]
+        assert models_to_agtype(models) == [
+            '{"name": "A", "age": 1}',
+            '{"name": "C", "industry": "tech"}',
+            '{"name": "B", "age": 2}',
+        ]
+        assert models_to_cypher_properties(models[:2]) == [
+            "{name: 'A', age: 1}",
+            "{name: 'C', industry: 'tech'}",
+        ]
+
+    def test_plain_template_matches_serializer(self):
+        from age_orm.utils.serialization import model_to_agtype
+        from tests.conftest import Person
+
+        assert Person._age_plain_dump
+        p = Person(name='say "hi"\n', age=3)
+        expected = to_agtype_properties(p.model_dump(mode="json"))
+        assert model_to_agtype(p) == expected
+        assert expected == '{"name": "say \\"hi\\"\\n", "age": 3, "email": null}'
+
+    def test_annotated_serializer_applied(self):
+        from typing import Annotated
+
+        from pydantic import PlainSerializer
+
+        from age_orm import Vertex
+        from age_orm.utils.serialization import models_to_agtype
+
+        class Shouty(Vertex):
+            name: Annotated[str, PlainSerializer(str.upper)]
+
+        assert models_to_agtype([Shouty(name="abc")]) == ['{"name": "ABC"}']
+
+
+class TestJsonLoads:
+    def test_object(self):
+        assert json_loads('{"a": [1, 2.5, "x", null, true]}') == {"a": [1, 2.5, "x", None, True]}
+
+    def test_nan_falls_back_to_stdlib(self):
+        result = json_loads('{"x": NaN}')
+        assert result["x"] != result["x"]
+
+    def test_without_orjson(self, monkeypatch):
+        import age_orm.utils.serialization as ser
+
+        monkeypatch.setattr(ser, "orjson", None)
+        assert ser.json_loads('{"a": 1}') == {"a": 1}
+
+    def test_invalid_raises_json_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{not json")
+
+
+class TestDictToModel:
+    def test_trusted_model_skips_validation(self):
+        from tests.conftest import Knows, Person
+
+        assert Person._age_trusted_load
+        p = dict_to_model(
+            {"graph_id": 5, "label": "Person", "properties": {"name": "A", "age": 3}}, Person
+        )
+        assert (p.name, p.age, p.email) == ("A", 3, None)
+        assert p.graph_id == 5 and p.label == "Person"
+        assert not p.is_dirty
+        p.age = 4
+        assert p.dirty_fields_dump() == {"age": 4}
+
+        row = {"graph_id": 6, "start_id": 1, "end_id": 2, "properties": {"since": 1}}
+        e = dict_to_model(row, Knows)
+        assert (e.start_id, e.end_id, e.relationship_type) == (1, 2, "friend")
+
+    def test_untrusted_model_is_validated(self):
+        import datetime
+
+        from age_orm.models.vertex import Vertex
+
+        class Event(Vertex):
+            __label__ = "Event"
+            on: datetime.date
+
+        assert not Event._age_trusted_load
+        ev = dict_to_model({"graph_id": 1, "properties": {"on": "2024-01-02"}}, Event)
+        assert ev.on == datetime.date(2024, 1, 2)
+        assert not ev.is_dirty
+
+    def test_annotated_validator_model_is_validated(self):
+        from typing import Annotated
+
+        from pydantic import AfterValidator
+
+        from age_orm.models.vertex import Vertex
+
+        class Coded(Vertex):
+            code: Annotated[str, AfterValidator(str.strip)]
+
+        assert not Coded._age_trusted_load and Coded._age_load is None
+        c = dict_to_model({"graph_id": 1, "properties": {"code": " a "}}, Coded)
+        assert c.code == "a"
+
+    def test_missing_required_field_still_raises(self):
+        from pydantic import ValidationError
+
+        from tests.conftest import Person
+
+        with pytest.raises(ValidationError):
+            dict_to_model({"graph_id": 1, "properties": {"name": "A"}}, Person)
+
+    def test_generated_loader_matches_model_construct(self):
+        from tests.conftest import Knows, Person
+
+        row = {"graph_id": 6, "start_id": 1, "end_id": 2, "properties": {"since": 1}}
+        for cls, data in ((Person, {"properties": {"name": "A", "age": 3}}), (Knows, row)):
+            assert cls._age_load is not None
+            fast = dict_to_model(data, cls)
+            slow = dict_to_model(data, cls, validate=True)
+            assert fast.__dict__ == slow.__dict__
+            assert list(fast.__dict__) == list(slow.__dict__)
+            assert fast.model_fields_set == slow.model_fields_set
+            fast.model_fields_set.add("x")
+
+    def test_no_loader_for_default_factory(self):
+        from pydantic import Field
+
+        from age_orm.models.vertex import Vertex
+
+        class Tagged(Vertex):
+            tag: str = Field(default_factory=lambda: "t")
+
+        assert Tagged._age_trusted_load and Tagged._age_load is None
+        assert dict_to_model({"graph_id": 1, "properties": {}}, Tagged).tag == "t"
+
+    def test_validate_forces_constructor(self):
+        from pydantic import ValidationError
+
+        from tests.conftest import Person
+
+        row = {"graph_id": 1, "properties": {"name": "A", "age": "three"}}
+        assert dict_to_model(row, Person).age == "three"
+        with pytest.raises(ValidationError):
+            dict_to_model(row, Person, validate=True)
+
+
+class TestParseAgtypeElement:
+    def test_vertex(self):
+        v = parse_agtype_vertex(' Person[1.5]{"name": "A"}\n')
+        assert v == {"label": "Person", "graph_id": 15, "properties": {"name": "A"}}
+
+    def test_edge(self):
+        e = parse_agtype_edge("KNOWS[2.1][1.5,1.6]{}")
+        assert e == {
+            "label": "KNOWS",
+            "graph_id": 21,
+            "start_id": 15,
+            "end_id": 16,
+            "properties": {},
+        }
+        assert parse_agtype_element("KNOWS[2.1][1.5,1.6]{}") == e
+
+    def test_id_digits_are_ascii(self):
+        assert parse_agtype_vertex("Caf\u00e9[1.5]{}")["label"] == "Caf\u00e9"
+        with pytest.raises(ValueError):
+            parse_agtype_vertex("Person[\u0661.5]{}")
+
+    def test_blank_properties(self):
+        assert parse_agtype_vertex("Person[1.5]{ }")["properties"] == {}
+
+    def test_kind_mismatch_raises(self):
+        with pytest.raises(ValueError, match="vertex"):
+            parse_agtype_vertex("KNOWS[2.1][1.5,1.6]{}")
+        with pytest.raises(ValueError, match="edge"):
+            parse_agtype_edge("Person[1.5]{}")
+        with pytest.raises(ValueError, match="element"):
+            parse_agtype_element("not agtype")